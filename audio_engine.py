@@ -0,0 +1,197 @@
+import os
+import struct
+import wave
+import numpy as np
+import bitbuffer
+import framing
+
+# Frames pulled from the WAV reader per step when embedding or extracting
+CHUNK_FRAMES = 4096
+
+# The streaming functions take an optional progress(done, total) callback, called with the
+# number of frames handled so far; an exception raised by it aborts the operation
+
+# RIFF layout used for memory-mapped embedding into uncompressed PCM WAV files
+RIFF_HEADER = struct.Struct('<4sI4s')
+RIFF_CHUNK = struct.Struct('<4sI')
+FMT_HEADER = struct.Struct('<HHIIH')  # format tag, channels, sample rate, byte rate, block align
+PCM_FORMATS = (1, 0xFFFE)  # WAVE_FORMAT_PCM, WAVE_FORMAT_EXTENSIBLE
+MAP_CHUNK = 1 << 20  # frame bytes rewritten per step, a multiple of 8
+
+# Payloads are written in the framed format (framing.pack); files from before that carry
+# the raw message followed by framing.TERMINATOR and are still read
+
+def capacity_bytes(song):
+    # One payload bit per frame byte, minus the frame header
+    frame_bytes = song.getnframes() * song.getsampwidth() * song.getnchannels()
+    return max(0, frame_bytes // 8 - framing.HEADER_SIZE)
+
+def _check_capacity(song, payload):
+    if payload.length > capacity_bytes(song):
+        raise ValueError("Insufficient audio frames, Need Bigger Audio file or give Less Data !!")
+
+bytes_to_bits = bitbuffer.from_bytes
+
+def embed_bits(samples, bits):
+    # Bit 1 (value 2) marks whether bit 3 (value 8) of the frame byte already equals the
+    # payload bit; when it does not, bit 0 carries the payload bit instead.
+    # Returns a modified copy of the first len(bits) frame bytes.
+    samples = samples[:len(bits)]
+    if len(samples) < len(bits):
+        raise ValueError("Insufficient audio frames, Need Bigger Audio file or give Less Data !!")
+    match = ((samples >> 3) & 1) == bits
+    return np.where(match, samples & 0xFD, (samples & 0xFC) | 2 | bits).astype(np.uint8)
+
+def extract_bits(samples):
+    return np.where(samples & 2, samples & 1, (samples >> 3) & 1).astype(np.uint8)
+
+def _iter_decoded(chunks):
+    # Decodes one payload byte per 8 frame bytes as the chunks arrive
+    buf = bitbuffer.BitBuffer()
+    for chunk in chunks:
+        buf.push_bits(extract_bits(np.frombuffer(chunk, dtype=np.uint8)))
+        yield buf.take_bytes()
+
+def extract_framed(chunks):
+    # Returns (flags, payload), or None when no payload is found. Chunks are only pulled
+    # until the header and `length` payload bytes are decoded, or for old files until the
+    # terminator has been seen.
+    decoded = _iter_decoded(chunks)
+    head = bytearray()
+    for block in decoded:
+        head += block
+        if len(head) >= framing.HEADER_SIZE:
+            break
+    header = framing.parse_header(head) if len(head) >= framing.HEADER_SIZE else None
+    if header is None:
+        scanner = framing.TerminatorScanner()
+        found = scanner.feed(bytes(head))
+        for block in decoded:
+            if found:
+                break
+            found = scanner.feed(block)
+        data = scanner.result()
+        return None if data is None else (0, data)
+    flags, length, crc = header
+    need = framing.HEADER_SIZE + length
+    if len(head) < need:
+        for block in decoded:
+            head += block
+            if len(head) >= need:
+                break
+    if len(head) < need:
+        raise ValueError("Hidden payload is longer than the audio file can hold")
+    return flags, framing.check(bytes(head[framing.HEADER_SIZE:need]), crc)
+
+def extract_stream(chunks):
+    found = extract_framed(chunks)
+    return None if found is None else found[1]
+
+def iter_frames(song, chunk_frames=CHUNK_FRAMES, progress=None):
+    total = song.getnframes()
+    frame_size = song.getsampwidth() * song.getnchannels()
+    done = 0
+    while True:
+        chunk = song.readframes(chunk_frames)
+        if not chunk:
+            return
+        yield chunk
+        done += len(chunk) // frame_size
+        if progress:
+            progress(done, total)
+
+def read_message(song, chunk_frames=CHUNK_FRAMES, progress=None):
+    return extract_stream(iter_frames(song, chunk_frames, progress))
+
+def read_framed(song, chunk_frames=CHUNK_FRAMES, progress=None):
+    return extract_framed(iter_frames(song, chunk_frames, progress))
+
+def embed_stream(song, fd, data, chunk_frames=CHUNK_FRAMES, progress=None, flags=0):
+    # Copies `song` to the writer `fd` chunk by chunk; only the chunks that carry payload
+    # bits are touched. `data` is bytes or a framing.Payload, which is read one block at a
+    # time; bits left over at a chunk boundary are carried to the next one.
+    payload = framing.as_payload(data, flags)
+    _check_capacity(song, payload)
+    framed = framing.iter_framed(payload)
+    nbits = len(payload) * 8
+    pos = 0
+    buf = bitbuffer.BitBuffer()
+    for chunk in iter_frames(song, chunk_frames, progress):
+        if pos < nbits:
+            samples = np.frombuffer(chunk, dtype=np.uint8)
+            need = min(len(samples), nbits - pos)
+            while len(buf) < need:
+                buf.push_bytes(next(framed))
+            head = embed_bits(samples, buf.take(need))
+            fd.writeframesraw(head.tobytes() + samples[len(head):].tobytes())
+            pos += need
+        else:
+            fd.writeframesraw(chunk)
+
+def find_data_chunk(f):
+    # Walks the RIFF chunks of an open binary WAV file without reading any samples.
+    # Returns (offset, size, block_align) of the sample data.
+    riff, _, wave_id = RIFF_HEADER.unpack(f.read(RIFF_HEADER.size).ljust(RIFF_HEADER.size, b'\0'))
+    if riff != b'RIFF' or wave_id != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE file")
+    file_size = os.fstat(f.fileno()).st_size
+    block_align = None
+    while True:
+        header = f.read(RIFF_CHUNK.size)
+        if len(header) < RIFF_CHUNK.size:
+            raise ValueError("WAV file has no data chunk")
+        chunk_id, size = RIFF_CHUNK.unpack(header)
+        start = f.tell()
+        if chunk_id == b'fmt ':
+            fmt_tag, _, _, _, block_align = FMT_HEADER.unpack(f.read(FMT_HEADER.size))
+            if fmt_tag not in PCM_FORMATS:
+                raise ValueError("Only uncompressed PCM WAV files can be embedded in place")
+        elif chunk_id == b'data':
+            if not block_align:
+                raise ValueError("WAV data chunk comes before its format chunk")
+            # Streamed recordings may leave the size unset; never map past the end of the file
+            return start, min(size, file_size - start), block_align
+        f.seek(start + size + (size & 1))
+
+def data_capacity(size, block_align):
+    # Payload bytes a data chunk of `size` bytes holds, whole frames only
+    return max(0, (size - size % block_align) // 8 - framing.HEADER_SIZE)
+
+def capacity_bytes_file(path):
+    with open(path, 'rb') as f:
+        _, size, block_align = find_data_chunk(f)
+    return data_capacity(size, block_align)
+
+def mapped_chunk(path, payload):
+    # (offset, size, block_align) of the data chunk of the WAV at `path`, after checking
+    # that it holds `payload`
+    with open(path, 'rb') as f:
+        offset, size, block_align = find_data_chunk(f)
+    if payload.length > data_capacity(size, block_align):
+        raise ValueError("Insufficient audio frames, Need Bigger Audio file or give Less Data !!")
+    return offset, size, block_align
+
+def embed_mapped(path, data, progress=None, flags=0, chunk=None):
+    # Embeds into the WAV file at `path` in place: only the frame bytes that carry payload
+    # bits are memory-mapped and rewritten, the rest of the file is never read or written.
+    # Gives the same sample bytes as write_stego and keeps every other chunk of the file.
+    # `chunk` is mapped_chunk's result when the caller has already checked the file.
+    payload = framing.as_payload(data, flags)
+    offset, size, block_align = chunk or mapped_chunk(path, payload)
+    nbits = len(payload) * 8
+    samples = np.memmap(path, dtype=np.uint8, mode='r+', offset=offset, shape=(nbits,))
+    for pos, block in zip(range(0, nbits, MAP_CHUNK), framing.iter_framed(payload, MAP_CHUNK // 8)):
+        stop = min(pos + MAP_CHUNK, nbits)
+        samples[pos:stop] = embed_bits(samples[pos:stop], bytes_to_bits(block))
+        if progress:
+            progress(-(-stop // block_align), -(-nbits // block_align))
+    samples.flush()
+    # Drops the mapping before the caller renames or reopens the file
+    del samples
+
+def write_stego(stegofile, song, data, chunk_frames=CHUNK_FRAMES, progress=None, flags=0):
+    data = framing.as_payload(data, flags)
+    _check_capacity(song, data)
+    with wave.open(stegofile, 'wb') as fd:
+        fd.setparams(song.getparams())
+        embed_stream(song, fd, data, chunk_frames, progress, flags)
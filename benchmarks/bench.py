@@ -0,0 +1,241 @@
+import argparse
+import io
+import json
+import math
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import rc4
+import stegapi
+
+# Reproducible benchmark of all four engines and the RC4 cipher on synthetic covers.
+# Every case runs in a fresh process, so its peak RSS is not inflated by earlier cases.
+# Video covers are written as FFV1 .mkv files to a temporary directory, so the container
+# decode and encode are timed along with the embedding; "stride" None is the single-frame
+# path, 1 spreads the payload over every frame. Results are written as JSON, e.g.
+#
+#   python benchmarks/bench.py --output results.json
+#   python benchmarks/bench.py --quick
+
+LOREM = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt "
+         "ut labore et dolore magna aliqua ut enim ad minim veniam quis nostrud exercitation "
+         "ullamco laboris nisi ut aliquip ex ea commodo consequat").split()
+
+KB = 1024
+
+# (media, cover parameters, payload sizes in bytes)
+CASES = [
+    ('image', {'width': 256, 'height': 256}, [KB, 16 * KB]),
+    ('image', {'width': 1280, 'height': 720}, [KB, 64 * KB, 256 * KB]),
+    ('image', {'width': 1920, 'height': 1080}, [KB, 256 * KB, 512 * KB]),
+    ('audio', {'seconds': 1}, [KB, 8 * KB]),
+    ('audio', {'seconds': 10}, [KB, 64 * KB]),
+    ('audio', {'seconds': 60}, [KB, 256 * KB, 1024 * KB]),
+    ('text', {'words': 10000}, [100, KB, 8 * KB]),
+    ('text', {'words': 200000}, [KB, 64 * KB, 128 * KB]),
+    ('video', {'width': 160, 'height': 120, 'frames': 30, 'stride': None}, [KB, 4 * KB]),
+    ('video', {'width': 160, 'height': 120, 'frames': 30, 'stride': 1}, [KB, 64 * KB]),
+    ('video', {'width': 640, 'height': 480, 'frames': 30, 'stride': None}, [KB, 64 * KB]),
+    ('video', {'width': 640, 'height': 480, 'frames': 30, 'stride': 1}, [KB, 512 * KB, 2048 * KB]),
+    ('rc4', {}, [64 * KB, 1024 * KB]),
+]
+QUICK_CASES = [
+    ('image', {'width': 256, 'height': 256}, [KB]),
+    ('audio', {'seconds': 1}, [KB]),
+    ('text', {'words': 10000}, [KB]),
+    ('video', {'width': 160, 'height': 120, 'frames': 10, 'stride': None}, [KB]),
+    ('video', {'width': 160, 'height': 120, 'frames': 10, 'stride': 1}, [KB]),
+    ('rc4', {}, [64 * KB]),
+]
+
+SAMPLE_RATE = 44100
+
+def make_image(rng, width, height):
+    return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+def make_wav(rng, seconds):
+    # 16-bit stereo: a 440 Hz sine with some noise on top
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    signal = 0.5 * np.sin(2 * math.pi * 440 * t) + 0.05 * rng.standard_normal(len(t))
+    samples = (np.clip(signal, -1, 1) * 32767).astype('<i2')
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(np.repeat(samples, 2).tobytes())
+    return buf.getvalue()
+
+def make_text(rng, words):
+    picks = rng.integers(0, len(LOREM), words)
+    return " ".join(LOREM[i] for i in picks)
+
+def make_video(rng, workdir, width, height, frames):
+    import video_engine
+    path = os.path.join(workdir, 'cover.mkv')
+    source = video_engine.FrameSource([make_image(rng, width, height) for _ in range(frames)])
+    out = video_engine.open_writer(path, source)
+    for frame in source.frames:
+        out.write(frame)
+    out.release()
+    return path
+
+def make_cover(media, params, rng, workdir):
+    if media == 'image':
+        return make_image(rng, **params)
+    if media == 'audio':
+        return make_wav(rng, **params)
+    if media == 'text':
+        return make_text(rng, **params)
+    if media == 'video':
+        return make_video(rng, workdir, params['width'], params['height'], params['frames'])
+    return None
+
+def cover_size(media, params, cover):
+    if media == 'image':
+        return cover.nbytes
+    if media == 'video':
+        # Decoded frame bytes, what the engine works through
+        return params['width'] * params['height'] * 3 * params['frames']
+    if media == 'text':
+        return len(cover.encode('utf-8'))
+    return len(cover) if cover is not None else 0
+
+def capacity(media, params, cover):
+    if media == 'image':
+        return stegapi.lsb_engine.capacity_bytes(cover)
+    if media == 'audio':
+        with wave.open(io.BytesIO(cover), 'rb') as song:
+            return stegapi.audio_engine.capacity_bytes(song)
+    if media == 'text':
+        return stegapi.text_engine.capacity_bytes(len(cover.split()))
+    if media == 'video':
+        return stegapi.capacity(cover, 'video', stride=params['stride'])
+    return math.inf
+
+def embed(media, params, cover, payload, workdir):
+    if media == 'image':
+        return stegapi.embed_image(cover, payload)
+    if media == 'audio':
+        return stegapi.embed_audio(cover, payload)
+    if media == 'text':
+        return stegapi.embed_text(io.StringIO(cover), payload)
+    if media == 'video':
+        return stegapi.embed_video(cover, payload, stride=params['stride'], out=os.path.join(workdir, 'stego.mkv'))
+    return rc4.crypt("benchmark key", payload)
+
+def extract(media, params, stego):
+    if media == 'image':
+        return stegapi.extract_image(stego)
+    if media == 'audio':
+        return stegapi.extract_audio(stego)
+    if media == 'text':
+        return stegapi.extract_text(io.StringIO(stego))
+    if media == 'video':
+        return stegapi.extract_video(stego, stride=params['stride'])
+    return rc4.crypt("benchmark key", stego)
+
+def best_time(fn, repeat):
+    best = math.inf
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def mb_per_s(size, seconds):
+    return round(size / seconds / 1e6, 3) if seconds > 0 else None
+
+def run_case(media, params, payload_size, seed, repeat):
+    with tempfile.TemporaryDirectory() as workdir:
+        return _run_case(media, params, payload_size, seed, repeat, workdir)
+
+def _run_case(media, params, payload_size, seed, repeat, workdir):
+    rng = np.random.default_rng(seed)
+    cover = make_cover(media, params, rng, workdir)
+    result = {'media': media, 'cover': params, 'cover_bytes': cover_size(media, params, cover),
+              'payload_bytes': payload_size}
+    if payload_size > capacity(media, params, cover):
+        result['skipped'] = "payload does not fit the cover"
+        return result
+    payload = rng.integers(0, 256, payload_size, dtype=np.uint8).tobytes()
+    embed_s, stego = best_time(lambda: embed(media, params, cover, payload, workdir), repeat)
+    extract_s, data = best_time(lambda: extract(media, params, stego), repeat)
+    result.update({
+        'embed_s': round(embed_s, 6),
+        'extract_s': round(extract_s, 6),
+        'embed_payload_mb_s': mb_per_s(payload_size, embed_s),
+        'extract_payload_mb_s': mb_per_s(payload_size, extract_s),
+        'embed_cover_mb_s': mb_per_s(result['cover_bytes'], embed_s),
+        'extract_cover_mb_s': mb_per_s(result['cover_bytes'], extract_s),
+        'roundtrip_ok': data == payload,
+        'peak_rss_kb': peak_rss_kb(),
+    })
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark embedding and extraction on synthetic covers.")
+    parser.add_argument('--output', help="write the JSON results to this file instead of stdout")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per case, the fastest one is reported")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quick', action='store_true', help="only run one small case per engine")
+    parser.add_argument('--media', nargs='*', help="only run these engines (image, audio, text, video, rc4)")
+    args = parser.parse_args(argv)
+
+    cases = QUICK_CASES if args.quick else CASES
+    if args.media:
+        cases = [case for case in cases if case[0] in args.media]
+    results = []
+    ctx = multiprocessing.get_context('spawn')
+    for media, params, payload_sizes in cases:
+        for payload_size in payload_sizes:
+            with ProcessPoolExecutor(1, mp_context=ctx) as pool:
+                result = pool.submit(run_case, media, params, payload_size, args.seed, args.repeat).result()
+            results.append(result)
+            if 'skipped' in result:
+                print(f"{media:5} {json.dumps(params)} {payload_size:>8} B  skipped", file=sys.stderr)
+            else:
+                print(f"{media:5} {json.dumps(params)} {payload_size:>8} B  embed {result['embed_s']:.4f} s"
+                      f"  extract {result['extract_s']:.4f} s", file=sys.stderr)
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0 if all(result.get('roundtrip_ok', True) for result in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
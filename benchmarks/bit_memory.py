@@ -0,0 +1,107 @@
+import argparse
+import io
+import os
+import sys
+import tempfile
+import tracemalloc
+import wave
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import audio_engine
+import framing
+import lsb_engine
+import text_engine
+
+# Memory regression check for the bit path of the engines. Every case embeds and extracts
+# a payload through the engine functions with the cover already loaded, and the peak
+# memory traced while doing so is divided by the number of payload bits. Bits are carried
+# as bitbuffer arrays (one byte per bit, one block at a time), so this stays at a few bytes
+# per bit and drops further once the payload is larger than one block; a Python str of
+# '0'/'1' with its slices costs several times more. Fails when a case is over the budget.
+#
+#   python benchmarks/bit_memory.py [--budget 4] [--payload-kb 256]
+
+DEFAULT_BUDGET = 4.0
+DEFAULT_PAYLOAD_KB = 256
+
+class NullWriter:
+    # Text sink that drops what it is given, so the stego text is not counted
+    def write(self, text):
+        return len(text)
+
+def traced_peak(fn):
+    # Peak traced bytes above what was allocated when fn started, and fn's result
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    return tracemalloc.get_traced_memory()[1] - start, result
+
+def image_case(rng, payload, workdir):
+    side = int(np.ceil(np.sqrt((len(payload) + framing.HEADER_SIZE) * 8 / 3))) + 1
+    img = rng.integers(0, 256, (side, side, 3), dtype=np.uint8)
+    embed = lambda: lsb_engine.embed_message(img, payload)
+    extract = lambda: lsb_engine.extract_message(img)
+    return embed, extract
+
+def audio_case(rng, payload, workdir):
+    path = os.path.join(workdir, 'cover.wav')
+    frames = (len(payload) + framing.HEADER_SIZE) * 8 // 4 + 1
+    with wave.open(path, 'wb') as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(rng.integers(0, 256, frames * 4, dtype=np.uint8).tobytes())
+
+    def extract():
+        with wave.open(path, 'rb') as song:
+            return audio_engine.read_message(song)
+    # The samples are changed through a memory map, which is not traced
+    return lambda: audio_engine.embed_mapped(path, payload), extract
+
+def text_case(rng, payload, workdir):
+    cover = " ".join(["word"] * (len(payload) + framing.HEADER_SIZE + 1))
+    stego = io.StringIO()
+    text_engine.embed(io.StringIO(cover), stego, payload)
+    # The readers are set up front, they hold a copy of the whole text
+    cover, stego = io.StringIO(cover), io.StringIO(stego.getvalue())
+    embed = lambda: text_engine.embed(cover, NullWriter(), payload)
+    extract = lambda: text_engine.extract(stego)
+    return embed, extract
+
+CASES = {'image': image_case, 'audio': audio_case, 'text': text_case}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the peak memory per payload bit of every engine.")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                        help=f"allowed peak bytes per payload bit (default {DEFAULT_BUDGET:g})")
+    parser.add_argument('--payload-kb', type=int, default=DEFAULT_PAYLOAD_KB,
+                        help=f"payload size (default {DEFAULT_PAYLOAD_KB} KB)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    payload = rng.integers(0, 256, args.payload_kb * 1024, dtype=np.uint8).tobytes()
+    bits = len(payload) * 8
+    failures = 0
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, case in CASES.items():
+            embed, extract = case(rng, payload, workdir)
+            embed_peak, _ = traced_peak(embed)
+            extract_peak, data = traced_peak(extract)
+            problems = []
+            if data != payload:
+                problems.append("round trip failed")
+            for step, peak in (('embed', embed_peak), ('extract', extract_peak)):
+                if peak / bits > args.budget:
+                    problems.append(f"{step} over the {args.budget:g} bytes per bit budget")
+            print(f"{name:6} embed {embed_peak / bits:6.2f}  extract {extract_peak / bits:6.2f} bytes per bit"
+                  f"  {'FAILED: ' + ', '.join(problems) if problems else 'ok'}")
+            failures += bool(problems)
+    tracemalloc.stop()
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Startup regression check for short-lived text and audio runs. Every scenario runs in a
+# fresh interpreter under `python -X importtime`; it fails when a heavy module that the
+# operation does not need gets imported, or when the total import time exceeds the budget.
+#
+#   python benchmarks/startup_budget.py [--budget-ms 400]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORBIDDEN = ('cv2', 'pandas', 'matplotlib')
+DEFAULT_BUDGET_MS = 400.0
+
+SCENARIOS = {
+    'text': '''
+import io, multimedia_steg, stegapi
+stego = stegapi.embed_text(io.StringIO("w " * 32), b"hi", key="k")
+assert stegapi.extract_text(io.StringIO(stego), key="k") == b"hi"
+''',
+    'audio': '''
+import io, wave, multimedia_steg, stegapi
+buf = io.BytesIO()
+with wave.open(buf, "wb") as w:
+    w.setnchannels(1); w.setsampwidth(2); w.setframerate(8000); w.writeframes(bytes(4000))
+stego = stegapi.embed_audio(buf.getvalue(), b"hi", key="k")
+assert stegapi.extract_audio(stego, key="k") == b"hi"
+''',
+    'batch': '''
+import stegbatch
+''',
+    'gui': '''
+import steggui
+''',
+}
+
+def parse_importtime(stderr):
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    total_us = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        total_us += int(fields[0])
+        modules.add(fields[2].strip().split('.')[0])
+    return total_us / 1000.0, modules
+
+def run_scenario(code):
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return parse_importtime(proc.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the import cost of text and audio runs.")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"allowed total import time per scenario (default {DEFAULT_BUDGET_MS:g} ms)")
+    parser.add_argument('scenarios', nargs='*', help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    failures = 0
+    for name in args.scenarios or SCENARIOS:
+        try:
+            import_ms, modules = run_scenario(SCENARIOS[name])
+        except RuntimeError as e:
+            if name == 'gui' and 'tkinter' in str(e):
+                print(f"{name:6} skipped (tkinter is not available)")
+                continue
+            print(f"{name:6} FAILED: {e}")
+            failures += 1
+            continue
+        problems = [f"imports {module}" for module in FORBIDDEN if module in modules]
+        if import_ms > args.budget_ms:
+            problems.append(f"over the {args.budget_ms:g} ms budget")
+        print(f"{name:6} {import_ms:8.1f} ms  {'FAILED: ' + ', '.join(problems) if problems else 'ok'}")
+        failures += bool(problems)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
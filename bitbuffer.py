@@ -0,0 +1,37 @@
+import numpy as np
+
+# Payload bits as np.uint8 arrays holding one 0/1 value per bit, most significant bit of
+# every byte first. This is the only bit representation the engines use: one byte per
+# bit while a block is being embedded or extracted, packed back into bytes right after.
+
+def from_bytes(data):
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+def to_bytes(bits):
+    # A trailing partial byte is zero-padded
+    return np.packbits(bits).tobytes()
+
+class BitBuffer:
+    # First-in first-out bit queue for blocks that do not line up with the bytes: bytes or
+    # bits go in at the end and bits or whole bytes come out at the front. Taking bits
+    # slices the backing array instead of copying it; it is only rebuilt when data is added.
+    def __init__(self):
+        self.bits = np.empty(0, dtype=np.uint8)
+
+    def __len__(self):
+        return len(self.bits)
+
+    def push_bits(self, bits):
+        self.bits = np.concatenate((self.bits, bits)) if len(self.bits) else bits
+
+    def push_bytes(self, data):
+        self.push_bits(from_bytes(data))
+
+    def take(self, n):
+        bits = self.bits[:n]
+        self.bits = self.bits[n:]
+        return bits
+
+    def take_bytes(self):
+        # Every whole byte that is buffered, the leftover bits stay for the next call
+        return to_bytes(self.take(len(self.bits) - len(self.bits) % 8))
@@ -0,0 +1,162 @@
+import importlib
+import io
+import struct
+import zlib
+
+# Fixed header in front of every framed payload: magic, version, flags, length, CRC32
+MAGIC = b'MSTG'
+VERSION = 1
+HEADER = struct.Struct('>4sBBII')
+HEADER_SIZE = HEADER.size
+
+# Bits 0-1 of the flags byte record how the payload was compressed before embedding
+COMPRESSION_MASK = 0x03
+COMPRESSION_FLAGS = {'zlib': 1, 'lzma': 2, 'bz2': 3}
+COMPRESSORS = {'zlib': 'compressobj', 'lzma': 'LZMACompressor', 'bz2': 'BZ2Compressor'}
+DECOMPRESSORS = {'zlib': 'decompressobj', 'lzma': 'LZMADecompressor', 'bz2': 'BZ2Decompressor'}
+# A compressed payload ends with its plain length. The hidden data comes from an untrusted
+# cover, so extraction never expands a payload past the length it records; any ratio the
+# compressor reached at embed time comes back out. A trailer keeps HEADER_SIZE the same
+# for every payload, the length is only known once the whole source has been compressed.
+PLAIN_LENGTH = struct.Struct('>Q')
+
+# Bytes read from a payload per step when it is streamed into a cover; a multiple of 3 so
+# that every block fills whole k-LSB symbols for every depth from 1 to 4
+STREAM_CHUNK = 3 << 18
+
+# Old stego files mark the end of the message with this sentinel instead
+TERMINATOR = b'*^*^*'
+
+def pack(payload, flags=0):
+    payload = bytes(payload)
+    return HEADER.pack(MAGIC, VERSION, flags, len(payload), zlib.crc32(payload)) + payload
+
+class Payload:
+    # Payload bytes behind a binary file object, so the engines can embed them block by
+    # block instead of holding them in memory. Length and CRC have to be known up front,
+    # the header is written before the data. Used as a context manager, it closes the
+    # source when the embed is done.
+    def __init__(self, source, length, crc, flags=0):
+        self.source = source
+        self.length = length
+        self.crc = crc
+        self.flags = flags
+        self.remaining = length
+
+    @classmethod
+    def from_bytes(cls, data, flags=0):
+        data = bytes(data)
+        return cls(io.BytesIO(data), len(data), zlib.crc32(data), flags)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.source.close()
+
+    def __len__(self):
+        # Size of the framed payload, header included
+        return HEADER_SIZE + self.length
+
+    def header(self):
+        return HEADER.pack(MAGIC, VERSION, self.flags, self.length, self.crc)
+
+    def read(self, n):
+        # Next n payload bytes (fewer at the end); a source that ends early is an error
+        data = self.source.read(min(n, self.remaining))
+        if len(data) < min(n, self.remaining):
+            raise ValueError("Payload source ended before its announced length")
+        self.remaining -= len(data)
+        return data
+
+def as_payload(data, flags=0):
+    return data if isinstance(data, Payload) else Payload.from_bytes(data, flags)
+
+def iter_framed(payload, size=STREAM_CHUNK):
+    # Header plus payload in blocks of exactly `size` bytes, only the last one is shorter
+    block = payload.header() + payload.read(size - HEADER_SIZE)
+    while block:
+        yield block
+        block = payload.read(size)
+
+def parse_header(header):
+    # Returns (flags, length, crc), or None when the bytes are not a framed header
+    magic, version, flags, length, crc = HEADER.unpack(bytes(header[:HEADER_SIZE]))
+    if magic != MAGIC:
+        return None
+    if version != VERSION:
+        raise ValueError(f"Unsupported payload version {version}")
+    return flags, length, crc
+
+def check(payload, crc):
+    if zlib.crc32(payload) != crc:
+        raise ValueError("Hidden payload is corrupted (CRC mismatch)")
+    return payload
+
+def unpack(data):
+    # Returns (flags, payload) for a complete framed byte string, or None when it is not framed
+    if len(data) < HEADER_SIZE:
+        return None
+    header = parse_header(data)
+    if header is None:
+        return None
+    flags, length, crc = header
+    payload = bytes(data[HEADER_SIZE:HEADER_SIZE + length])
+    if len(payload) < length:
+        raise ValueError("Hidden payload is truncated")
+    return flags, check(payload, crc)
+
+def compressor(method=None):
+    # Incremental compressor (compress(block) ... flush()) for `method`, None for no
+    # compression; lzma and bz2 are only imported when asked for
+    if method is None:
+        return None
+    if method not in COMPRESSION_FLAGS:
+        raise ValueError(f"Unknown compression '{method}', use one of {', '.join(COMPRESSION_FLAGS)}")
+    return getattr(importlib.import_module(method), COMPRESSORS[method])()
+
+def decompress(data, flags, max_length=None):
+    # `max_length` optionally refuses payloads that record a larger plain length
+    flag = flags & COMPRESSION_MASK
+    if data is None or not flag:
+        return data
+    method = next(name for name, value in COMPRESSION_FLAGS.items() if value == flag)
+    if len(data) < PLAIN_LENGTH.size:
+        raise ValueError("Hidden payload is truncated")
+    (length,) = PLAIN_LENGTH.unpack(data[-PLAIN_LENGTH.size:])
+    if max_length is not None and length > max_length:
+        raise ValueError(f"Hidden payload expands to more than {max_length} bytes, refusing to decompress it")
+    decompressor = getattr(importlib.import_module(method), DECOMPRESSORS[method])()
+    try:
+        # One byte more than recorded tells a payload that is too large from one that fits exactly
+        plain = decompressor.decompress(memoryview(data)[:-PLAIN_LENGTH.size], length + 1)
+    except Exception as e:
+        raise ValueError(f"Hidden payload could not be decompressed with {method} (wrong key?)") from e
+    if len(plain) > length:
+        raise ValueError(f"Hidden payload expands past its recorded {length} bytes, refusing to decompress it")
+    if len(plain) < length or not decompressor.eof:
+        raise ValueError(f"Hidden payload could not be decompressed with {method} (wrong key?)")
+    return plain
+
+class TerminatorScanner:
+    # Incremental search for the legacy terminator: every byte is looked at once,
+    # only the last len(TERMINATOR) - 1 bytes are searched again across feeds
+    def __init__(self, terminator=TERMINATOR):
+        self.terminator = terminator
+        self.data = bytearray()
+        self.found = False
+
+    def feed(self, chunk):
+        start = max(0, len(self.data) - len(self.terminator) + 1)
+        self.data += chunk
+        end = self.data.find(self.terminator, start)
+        if end != -1:
+            del self.data[end:]
+            self.found = True
+        return self.found
+
+    def result(self):
+        return bytes(self.data) if self.found else None
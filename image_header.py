@@ -0,0 +1,62 @@
+import struct
+
+# Reads the pixel dimensions of an image from its file header, without decoding any pixel
+# data. Covers PNG, JPEG and BMP; read_size() returns None for anything else.
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# JPEG start-of-frame markers; C4, C8 and CC share the range but are not frame headers
+JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# JPEG markers that stand alone without a length field
+JPEG_STANDALONE = set(range(0xD0, 0xDA)) | {0x01}
+
+def _png_size(f):
+    f.seek(8)
+    length, chunk_type, width, height = struct.unpack('>I4sII', f.read(16))
+    if chunk_type != b'IHDR':
+        raise ValueError("PNG file does not start with an IHDR chunk")
+    return width, height
+
+def _jpeg_size(f):
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("JPEG file has no frame header")
+        if byte != b'\xff':
+            continue
+        marker = f.read(1)
+        while marker == b'\xff':
+            # Fill bytes before the marker
+            marker = f.read(1)
+        if not marker:
+            raise ValueError("JPEG file has no frame header")
+        marker = marker[0]
+        if marker in JPEG_STANDALONE or marker == 0:
+            continue
+        length = struct.unpack('>H', f.read(2))[0]
+        if marker in JPEG_SOF:
+            _, height, width = struct.unpack('>BHH', f.read(5))
+            return width, height
+        f.seek(length - 2, 1)
+
+def _bmp_size(f):
+    f.seek(14)
+    header_size = struct.unpack('<I', f.read(4))[0]
+    if header_size == 12:
+        # OS/2 BITMAPCOREHEADER
+        return struct.unpack('<HH', f.read(4))
+    width, height = struct.unpack('<ii', f.read(8))
+    # A negative height marks a top-down bitmap
+    return width, abs(height)
+
+def read_size(path):
+    # Returns (width, height), or None when the format is not one of the above
+    with open(path, 'rb') as f:
+        start = f.read(8)
+        if start.startswith(PNG_SIGNATURE):
+            return _png_size(f)
+        if start.startswith(b'\xff\xd8'):
+            return _jpeg_size(f)
+        if start.startswith(b'BM'):
+            return _bmp_size(f)
+    return None
@@ -0,0 +1,152 @@
+import math
+import numpy as np
+import bitbuffer
+import framing
+
+# Bits unpacked per step while scanning old terminator-style stego images
+SCAN_CHUNK_BITS = 1 << 20
+# Payload bytes embedded or extracted per step; small enough to give a 1080p image about
+# 16 progress reports, and a multiple of 3 so every block fills whole k-LSB symbols
+BLOCK_BYTES = 3 << 14
+
+# The bit functions take an optional `order`: a pixel_order map, sliced into the flat
+# indices of the channel values that carry the bits. None is raster order and plain slicing.
+# `depth` is the number of low bits used in every channel value (k-LSB); the payload bits
+# are grouped into depth-bit symbols, most significant bit first.
+# The payload functions take an optional progress(done, total) callback, called after every
+# block with the pixels handled so far; an exception raised by it aborts the operation.
+MAX_DEPTH = 4
+
+def capacity_bytes(img, depth=1):
+    # `depth` bits in every channel value: (h * w * 3 * depth) // 8, minus the frame header
+    return capacity_for_shape(img.shape, depth)
+
+def capacity_for_shape(shape, depth=1):
+    # Same as capacity_bytes, for an image that has not been loaded
+    _check_depth(depth)
+    return max(0, math.prod(shape) * depth // 8 - framing.HEADER_SIZE)
+
+bytes_to_bits = bitbuffer.from_bytes
+bits_to_bytes = bitbuffer.to_bytes
+
+def _flat_view(img):
+    flat = img.reshape(-1)
+    if not np.shares_memory(flat, img):
+        raise ValueError("Cover array must be C-contiguous to be modified in place")
+    return flat
+
+def _check_order(flat, order):
+    if order is not None and len(order) != flat.size:
+        raise ValueError("Pixel order does not match the image size")
+
+def _check_depth(depth):
+    if not 1 <= depth <= MAX_DEPTH:
+        raise ValueError(f"Bits per channel must be between 1 and {MAX_DEPTH}")
+
+def bits_to_symbols(bits, depth):
+    # Packs every `depth` bits (zero-padded at the end) into the low bits of one value
+    bits = np.concatenate((bits, np.zeros(-len(bits) % depth, dtype=np.uint8)))
+    return np.packbits(bits.reshape(-1, depth), axis=1)[:, 0] >> (8 - depth)
+
+def symbols_to_bits(values, depth):
+    return np.unpackbits(values.astype(np.uint8)[:, None], axis=1)[:, 8 - depth:].reshape(-1)
+
+def embed_bits(img, bits, order=None, depth=1, start=0):
+    # `start` is in payload bits like in extract_bits and has to be a multiple of `depth`
+    flat = _flat_view(img)
+    _check_order(flat, order)
+    _check_depth(depth)
+    values = bits if depth == 1 else bits_to_symbols(bits, depth)
+    first = start // depth
+    stop = first + len(values)
+    if stop > flat.size:
+        raise ValueError("Insufficient bytes Error, Need Bigger Image or give Less Data !!")
+    keep = 0xFF ^ ((1 << depth) - 1)
+    if order is None:
+        # Channels are filled in raster order R, G, B exactly like the per-pixel loop did
+        flat[first:stop] = (flat[first:stop] & keep) | values
+    else:
+        # Only the entries of the map for these bits are used, so the cost follows the payload size
+        index = order[first:stop]
+        flat[index] = (flat[index] & keep) | values
+    return img
+
+def extract_bits(img, count=None, start=0, order=None, depth=1):
+    # `count` and `start` are in payload bits, whatever the depth
+    flat = img.reshape(-1)
+    _check_order(flat, order)
+    _check_depth(depth)
+    stop = flat.size * depth if count is None else start + count
+    first, last = start // depth, -(-stop // depth)
+    values = flat[first:last] if order is None else flat[order[first:last]]
+    if depth == 1:
+        return values & 1
+    skip = start - first * depth
+    return symbols_to_bits(values, depth)[skip:skip + stop - start]
+
+def read_bytes(img, offset, count, order=None, depth=1):
+    bits = extract_bits(img, count * 8, offset * 8, order, depth)
+    if len(bits) < count * 8:
+        raise ValueError("Hidden payload is longer than the image can hold")
+    return bits_to_bytes(bits)
+
+def embed_message(img, data, order=None, depth=1, flags=0):
+    return embed_payload(img, framing.Payload.from_bytes(data, flags), order, depth)
+
+def _pixels(bits, depth):
+    # Pixels whose channel values carry `bits` payload bits
+    return -(-bits // (depth * 3))
+
+def embed_payload(img, payload, order=None, depth=1, progress=None):
+    # Embeds a framing.Payload block by block, so only one block of bits is unpacked at a time
+    if len(payload) * 8 > img.size * depth:
+        raise ValueError("Insufficient bytes Error, Need Bigger Image or give Less Data !!")
+    total = _pixels(len(payload) * 8, depth)
+    start = 0
+    for block in framing.iter_framed(payload, BLOCK_BYTES):
+        bits = bytes_to_bits(block)
+        embed_bits(img, bits, order, depth, start)
+        start += len(bits)
+        if progress:
+            progress(_pixels(start, depth), total)
+    return img
+
+def extract_framed(img, order=None, depth=1, progress=None):
+    # Returns (flags, hidden bytes), or None when the image carries no payload
+    if img.size * depth // 8 >= framing.HEADER_SIZE:
+        header = framing.parse_header(read_bytes(img, 0, framing.HEADER_SIZE, order, depth))
+        if header is not None:
+            flags, length, crc = header
+            end = framing.HEADER_SIZE + length
+            if end * 8 > img.size * depth:
+                raise ValueError("Hidden payload is longer than the image can hold")
+            data = bytearray()
+            for offset in range(framing.HEADER_SIZE, end, BLOCK_BYTES):
+                stop = min(offset + BLOCK_BYTES, end)
+                data += read_bytes(img, offset, stop - offset, order, depth)
+                if progress:
+                    progress(_pixels(stop * 8, depth), _pixels(end * 8, depth))
+            return flags, framing.check(bytes(data), crc)
+    if order is not None or depth != 1:
+        # Terminator-style images were always written one bit per value in raster order
+        return None
+    data = extract_message_legacy(img, progress)
+    return None if data is None else (0, data)
+
+def extract_message(img, order=None, depth=1):
+    # Returns the hidden bytes, or None when the image carries no payload
+    found = extract_framed(img, order, depth)
+    return None if found is None else found[1]
+
+def extract_message_legacy(img, progress=None):
+    flat = img.reshape(-1)
+    usable = flat.size - flat.size % 8
+    scanner = framing.TerminatorScanner()
+    for start in range(0, usable, SCAN_CHUNK_BITS):
+        stop = min(start + SCAN_CHUNK_BITS, usable)
+        found = scanner.feed(bits_to_bytes(flat[start:stop] & 1))
+        if progress:
+            progress(_pixels(stop, 1), _pixels(usable, 1))
+        if found:
+            break
+    return scanner.result()
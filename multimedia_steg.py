@@ -1,584 +1,335 @@
-import numpy as np
-import pandas as pd
-import os
-import cv2
-from matplotlib import pyplot as plt
-
-def txt_encode(text, cover_file_path):
-    l = len(text)
-    i = 0
-    add = ''
-    while i < l:
-        t = ord(text[i])
-        if(t >= 32 and t <= 64):
-            t1 = t + 48
-            t2 = t1 ^ 170       #170: 10101010
-            res = bin(t2)[2:].zfill(8)
-            add += "0011" + res
-        
-        else:
-            t1 = t - 48
-            t2 = t1 ^ 170
-            res = bin(t2)[2:].zfill(8)
-            add += "0110" + res
-        i += 1
-    res1 = add + "111111111111"
-    print("The string after binary conversion applying all the transformation:- " + (res1))   
-    length = len(res1)
-    print("Length of binary after conversion:- ", length)
-    HM_SK = ""
-    ZWC = {"00": u'\u200C', "01": u'\u202C', "11": u'\u202D', "10": u'\u200E'}      
-    file1 = open(cover_file_path, "r+")
-    nameoffile = input("\nEnter the name of the Stego file after Encoding(with extension):- ")
-    file3 = open(nameoffile, "w+", encoding="utf-8")
-    word = []
-    for line in file1: 
-        word += line.split()
-    i = 0
-    while(i < len(res1)):  
-        s = word[int(i/12)]
-        j = 0
-        x = ""
-        HM_SK = ""
-        while(j < 12):
-            x = res1[j+i] + res1[i+j+1]
-            HM_SK += ZWC[x]
-            j += 2
-        s1 = s + HM_SK
-        file3.write(s1)
-        file3.write(" ")
-        i += 12
-    t = int(len(res1)/12)     
-    while t < len(word): 
-        file3.write(word[t])
-        file3.write(" ")
-        t += 1
-    file3.close()  
-    file1.close()
-    print("\nStego file has successfully generated")
-
-def encode_txt_data():
-    cover_file_path = input("\nEnter the path to your cover text file:- ")
-    
-    # Check if file exists
-    if not os.path.exists(cover_file_path):
-        print(f"Error: File '{cover_file_path}' not found!")
-        return
-    
-    count2 = 0
-    file1 = open(cover_file_path, "r")
-    for line in file1: 
-        for word in line.split():
-            count2 = count2 + 1
-    file1.close()       
-    bt = int(count2)
-    print("Maximum number of words that can be inserted:- ", int(bt/6))
-    text1 = input("\nEnter data to be encoded:- ")
-    l = len(text1)
-    if(l <= bt):
-        print("\nInputed message can be hidden in the cover file\n")
-        txt_encode(text1, cover_file_path)
-    else:
-        print("\nString is too big please reduce string size")
-        encode_txt_data()
-
-def BinaryToDecimal(binary):
-    string = int(binary, 2)
-    return string
-
-def decode_txt_data():
-    ZWC_reverse = {u'\u200C': "00", u'\u202C': "01", u'\u202D': "11", u'\u200E': "10"}
-    stego = input("\nPlease enter the stego file path to decode the message:- ")
-    
-    # Check if file exists
-    if not os.path.exists(stego):
-        print(f"Error: File '{stego}' not found!")
-        return
-        
-    file4 = open(stego, "r", encoding="utf-8")
-    temp = ''
-    for line in file4: 
-        for words in line.split():
-            T1 = words
-            binary_extract = ""
-            for letter in T1:
-                if(letter in ZWC_reverse):
-                     binary_extract += ZWC_reverse[letter]
-            if binary_extract == "111111111111":
-                break
-            else:
-                temp += binary_extract
-    print("\nEncrypted message presented in code bits:", temp) 
-    lengthd = len(temp)
-    print("\nLength of encoded bits:- ", lengthd)
-    i = 0
-    a = 0
-    b = 4
-    c = 4
-    d = 12
-    final = ''
-    while i < len(temp):
-        t3 = temp[a:b]
-        a += 12
-        b += 12
-        i += 12
-        t4 = temp[c:d]
-        c += 12
-        d += 12
-        if(t3 == '0110'):
-            decimal_data = BinaryToDecimal(t4)
-            final += chr((decimal_data ^ 170) + 48)
-        elif(t3 == '0011'):
-            decimal_data = BinaryToDecimal(t4)
-            final += chr((decimal_data ^ 170) - 48)
-    print("\nMessage after decoding from the stego file:- ", final)
-
-def txt_steg():
-    while True:
-        print("\n\t\tTEXT STEGANOGRAPHY OPERATIONS") 
-        print("1. Encode the Text message")  
-        print("2. Decode the Text message")  
-        print("3. Exit")  
-        choice1 = int(input("Enter the Choice:"))   
-        if choice1 == 1:
-            encode_txt_data()
-        elif choice1 == 2:
-            decode_txt_data() 
-        elif choice1 == 3:
-            break
-        else:
-            print("Incorrect Choice")
-        print("\n")
-
-def msgtobinary(msg):
-    if type(msg) == str:
-        result = ''.join([format(ord(i), "08b") for i in msg])
-    
-    elif type(msg) == bytes or type(msg) == np.ndarray:
-        result = [format(i, "08b") for i in msg]
-    
-    elif type(msg) == int or type(msg) == np.uint8:
-        result = format(msg, "08b")
-
-    else:
-        raise TypeError("Input type is not supported in this function")
-    
-    return result
-
-def encode_img_data():
-    img_path = input("\nEnter the path to your cover image file:- ")
-    
-    # Check if file exists
-    if not os.path.exists(img_path):
-        print(f"Error: File '{img_path}' not found!")
-        return
-    
-    img = cv2.imread(img_path)
-    
-    data = input("\nEnter the data to be Encoded in Image:- ")    
-    if (len(data) == 0): 
-        raise ValueError('Data entered to be encoded is empty')
-  
-    nameoffile = input("\nEnter the name of the New Image (Stego Image) after Encoding(with extension):- ")
-    
-    no_of_bytes = (img.shape[0] * img.shape[1] * 3) // 8
-    
-    print("\t\nMaximum bytes to encode in Image:", no_of_bytes)
-    
-    if(len(data) > no_of_bytes):
-        raise ValueError("Insufficient bytes Error, Need Bigger Image or give Less Data !!")
-    
-    data += '*^*^*'    
-    
-    binary_data = msgtobinary(data)
-    print("\n")
-    print(binary_data)
-    length_data = len(binary_data)
-    
-    print("\nThe Length of Binary data", length_data)
-    
-    index_data = 0
-    
-    for i in img:
-        for pixel in i:
-            r, g, b = msgtobinary(pixel)
-            if index_data < length_data:
-                pixel[0] = int(r[:-1] + binary_data[index_data], 2) 
-                index_data += 1
-            if index_data < length_data:
-                pixel[1] = int(g[:-1] + binary_data[index_data], 2) 
-                index_data += 1
-            if index_data < length_data:
-                pixel[2] = int(b[:-1] + binary_data[index_data], 2) 
-                index_data += 1
-            if index_data >= length_data:
-                break
-    cv2.imwrite(nameoffile, img)
-    print("\nEncoded the data successfully in the Image and the image is successfully saved with name", nameoffile)
-
-def decode_img_data():
-    img_path = input("Enter the path to the stego image you need to decode:- ")
-    
-    # Check if file exists
-    if not os.path.exists(img_path):
-        print(f"Error: File '{img_path}' not found!")
-        return
-        
-    img = cv2.imread(img_path)
-    
-    data_binary = ""
-    for i in img:
-        for pixel in i:
-            r, g, b = msgtobinary(pixel) 
-            data_binary += r[-1]  
-            data_binary += g[-1]  
-            data_binary += b[-1]  
-            total_bytes = [data_binary[i: i+8] for i in range(0, len(data_binary), 8)]
-            decoded_data = ""
-            for byte in total_bytes:
-                decoded_data += chr(int(byte, 2))
-                if decoded_data[-5:] == "*^*^*": 
-                    print("\n\nThe Encoded data which was hidden in the Image was:--", decoded_data[:-5])
-                    return 
-
-def img_steg():
-    while True:
-        print("\n\t\tIMAGE STEGANOGRAPHY OPERATIONS\n") 
-        print("1. Encode the Text message") 
-        print("2. Decode the Text message") 
-        print("3. Exit")  
-        choice1 = int(input("Enter the Choice: "))   
-        if choice1 == 1:
-            encode_img_data()
-        elif choice1 == 2:
-            decode_img_data()
-        elif choice1 == 3:
-            break
-        else:
-            print("Incorrect Choice")
-        print("\n")
-
-def encode_aud_data():
-    import wave
-
-    nameoffile = input("Enter path to your cover audio file (with extension):- ")
-    
-    # Check if file exists
-    if not os.path.exists(nameoffile):
-        print(f"Error: File '{nameoffile}' not found!")
-        return
-        
-    song = wave.open(nameoffile, mode='rb')
-
-    nframes = song.getnframes()
-    frames = song.readframes(nframes)
-    frame_list = list(frames)
-    frame_bytes = bytearray(frame_list)
-
-    data = input("\nEnter the secret message:- ")
-
-    res = ''.join(format(i, '08b') for i in bytearray(data, encoding='utf-8'))     
-    print("\nThe string after binary conversion:- " + (res))   
-    length = len(res)
-    print("\nLength of binary after conversion:- ", length)
-
-    data = data + '*^*^*'
-
-    result = []
-    for c in data:
-        bits = bin(ord(c))[2:].zfill(8)
-        result.extend([int(b) for b in bits])
-
-    j = 0
-    for i in range(0, len(result), 1): 
-        res = bin(frame_bytes[j])[2:].zfill(8)
-        if res[len(res)-4] == result[i]:
-            frame_bytes[j] = (frame_bytes[j] & 253)      #253: 11111101
-        else:
-            frame_bytes[j] = (frame_bytes[j] & 253) | 2
-            frame_bytes[j] = (frame_bytes[j] & 254) | result[i]
-        j = j + 1
-    
-    frame_modified = bytes(frame_bytes)
-
-    stegofile = input("\nEnter name of the stego file (with extension):- ")
-    with wave.open(stegofile, 'wb') as fd:
-        fd.setparams(song.getparams())
-        fd.writeframes(frame_modified)
-    print("\nEncoded the data successfully in the audio file.")    
-    song.close()
-
-def decode_aud_data():
-    import wave
-
-    nameoffile = input("Enter path to the stego audio file to be decoded:- ")
-    
-    # Check if file exists
-    if not os.path.exists(nameoffile):
-        print(f"Error: File '{nameoffile}' not found!")
-        return
-        
-    song = wave.open(nameoffile, mode='rb')
-
-    nframes = song.getnframes()
-    frames = song.readframes(nframes)
-    frame_list = list(frames)
-    frame_bytes = bytearray(frame_list)
-
-    extracted = ""
-    p = 0
-    for i in range(len(frame_bytes)):
-        if(p == 1):
-            break
-        res = bin(frame_bytes[i])[2:].zfill(8)
-        if res[len(res)-2] == '0':
-            extracted += res[len(res)-4]
-        else:
-            extracted += res[len(res)-1]
-    
-        all_bytes = [extracted[i: i+8] for i in range(0, len(extracted), 8)]
-        decoded_data = ""
-        for byte in all_bytes:
-            decoded_data += chr(int(byte, 2))
-            if decoded_data[-5:] == "*^*^*":
-                print("The Encoded data was:--", decoded_data[:-5])
-                p = 1
-                break  
-
-def aud_steg():
-    while True:
-        print("\n\t\tAUDIO STEGANOGRAPHY OPERATIONS") 
-        print("1. Encode the Text message")  
-        print("2. Decode the Text message")  
-        print("3. Exit")  
-        choice1 = int(input("Enter the Choice:"))   
-        if choice1 == 1:
-            encode_aud_data()
-        elif choice1 == 2:
-            decode_aud_data()
-        elif choice1 == 3:
-            break
-        else:
-            print("Incorrect Choice")
-        print("\n")
-
-def KSA(key):
-    key_length = len(key)
-    S = list(range(256)) 
-    j = 0
-    for i in range(256):
-        j = (j+S[i]+key[i % key_length]) % 256
-        S[i], S[j] = S[j], S[i]
-    return S
-
-def PRGA(S, n):
-    i = 0
-    j = 0
-    key = []
-    while n > 0:
-        n = n-1
-        i = (i+1) % 256
-        j = (j+S[i]) % 256
-        S[i], S[j] = S[j], S[i]
-        K = S[(S[i]+S[j]) % 256]
-        key.append(K)
-    return key
-
-def preparing_key_array(s):
-    return [ord(c) for c in s]
-
-def encryption(plaintext):
-    print("Enter the key: ")
-    key = input()
-    key = preparing_key_array(key)
-
-    S = KSA(key)
-
-    keystream = np.array(PRGA(S, len(plaintext)))
-    plaintext = np.array([ord(i) for i in plaintext])
-
-    cipher = keystream ^ plaintext
-    ctext = ''
-    for c in cipher:
-        ctext = ctext + chr(c)
-    return ctext
-
-def decryption(ciphertext):
-    print("Enter the key: ")
-    key = input()
-    key = preparing_key_array(key)
-
-    S = KSA(key)
-
-    keystream = np.array(PRGA(S, len(ciphertext)))
-    ciphertext = np.array([ord(i) for i in ciphertext])
-
-    decoded = keystream ^ ciphertext
-    dtext = ''
-    for c in decoded:
-        dtext = dtext + chr(c)
-    return dtext
-
-def embed(frame):
-    data = input("\nEnter the data to be Encoded in Video:") 
-    data = encryption(data)
-    print("The encrypted data is:", data)
-    if (len(data) == 0): 
-        raise ValueError('Data entered to be encoded is empty')
-
-    data += '*^*^*'
-    
-    binary_data = msgtobinary(data)
-    length_data = len(binary_data)
-    
-    index_data = 0
-    
-    for i in frame:
-        for pixel in i:
-            r, g, b = msgtobinary(pixel)
-            if index_data < length_data:
-                pixel[0] = int(r[:-1] + binary_data[index_data], 2) 
-                index_data += 1
-            if index_data < length_data:
-                pixel[1] = int(g[:-1] + binary_data[index_data], 2) 
-                index_data += 1
-            if index_data < length_data:
-                pixel[2] = int(b[:-1] + binary_data[index_data], 2) 
-                index_data += 1
-            if index_data >= length_data:
-                break
-        return frame
-
-def extract(frame):
-    data_binary = ""
-    final_decoded_msg = ""
-    for i in frame:
-        for pixel in i:
-            r, g, b = msgtobinary(pixel) 
-            data_binary += r[-1]  
-            data_binary += g[-1]  
-            data_binary += b[-1]  
-            total_bytes = [data_binary[i: i+8] for i in range(0, len(data_binary), 8)]
-            decoded_data = ""
-            for byte in total_bytes:
-                decoded_data += chr(int(byte, 2))
-                if decoded_data[-5:] == "*^*^*": 
-                    for i in range(0, len(decoded_data)-5):
-                        final_decoded_msg += decoded_data[i]
-                    final_decoded_msg = decryption(final_decoded_msg)
-                    print("\n\nThe Encoded data which was hidden in the Video was:--\n", final_decoded_msg)
-                    return 
-
-def encode_vid_data():
-    video_path = input("\nEnter the path to your cover video file:- ")
-    
-    # Check if file exists
-    if not os.path.exists(video_path):
-        print(f"Error: File '{video_path}' not found!")
-        return
-        
-    cap = cv2.VideoCapture(video_path)
-    vidcap = cv2.VideoCapture(video_path)    
-    fourcc = cv2.VideoWriter_fourcc(*'XVID')
-    frame_width = int(vidcap.get(3))
-    frame_height = int(vidcap.get(4))
-
-    size = (frame_width, frame_height)
-    out = cv2.VideoWriter('stego_video.mp4', fourcc, 25.0, size)
-    max_frame = 0
-    while(cap.isOpened()):
-        ret, frame = cap.read()
-        if ret == False:
-            break
-        max_frame += 1
-    cap.release()
-    print("Total number of Frame in selected Video:", max_frame)
-    print("Enter the frame number where you want to embed data: ")
-    n = int(input())
-    frame_number = 0
-    while(vidcap.isOpened()):
-        frame_number += 1
-        ret, frame = vidcap.read()
-        if ret == False:
-            break
-        if frame_number == n:    
-            change_frame_with = embed(frame)
-            frame_ = change_frame_with
-            frame = change_frame_with
-        out.write(frame)
-    
-    print("\nEncoded the data successfully in the video file.")
-    return frame_
-
-def decode_vid_data(frame_):
-    video_path = input("\nEnter the path to your stego video file:- ")
-    
-    # Check if file exists
-    if not os.path.exists(video_path):
-        print(f"Error: File '{video_path}' not found!")
-        return
-        
-    cap = cv2.VideoCapture(video_path)
-    max_frame = 0
-    while(cap.isOpened()):
-        ret, frame = cap.read()
-        if ret == False:
-            break
-        max_frame += 1
-    print("Total number of Frame in selected Video:", max_frame)
-    print("Enter the secret frame number from where you want to extract data")
-    n = int(input())
-    vidcap = cv2.VideoCapture(video_path)
-    frame_number = 0
-    while(vidcap.isOpened()):
-        frame_number += 1
-        ret, frame = vidcap.read()
-        if ret == False:
-            break
-        if frame_number == n:
-            extract(frame_)
-            return
-
-def vid_steg():
-    while True:
-        print("\n\t\tVIDEO STEGANOGRAPHY OPERATIONS") 
-        print("1. Encode the Text message")  
-        print("2. Decode the Text message")  
-        print("3. Exit")  
-        choice1 = int(input("Enter the Choice:"))   
-        if choice1 == 1:
-            a = encode_vid_data()
-        elif choice1 == 2:
-            decode_vid_data(a)
-        elif choice1 == 3:
-            break
-        else:
-            print("Incorrect Choice")
-        print("\n")
-
-def main():
-    print("\t\t      STEGANOGRAPHY")   
-    while True:  
-        print("\n\t\t\tMAIN MENU\n")  
-        print("1. IMAGE STEGANOGRAPHY {Hiding Text in Image cover file}")  
-        print("2. TEXT STEGANOGRAPHY {Hiding Text in Text cover file}")  
-        print("3. AUDIO STEGANOGRAPHY {Hiding Text in Audio cover file}")
-        print("4. VIDEO STEGANOGRAPHY {Hiding Text in Video cover file}")
-        print("5. Exit\n")  
-        choice1 = int(input("Enter the Choice: "))   
-        if choice1 == 1: 
-            img_steg()
-        elif choice1 == 2:
-            txt_steg()
-        elif choice1 == 3:
-            aud_steg()
-        elif choice1 == 4:
-            vid_steg()
-        elif choice1 == 5:
-            break
-        else:
-            print("Incorrect Choice")
-        print("\n\n")
-
-if __name__ == "__main__":
+import os
+import sys
+import framing
+import stegapi
+import stegbatch
+
+# The menus below only collect paths, messages and keys; the work is done by stegapi.
+# OpenCV is only imported by the image and video handlers that need it.
+# Typed messages are hidden as UTF-8, data files are streamed from disk.
+
+def input_key():
+    print("Enter the key: ")
+    return input()
+
+def txt_encode(text, cover_file_path):
+    payload = text.encode('utf-8')
+    print("Length of binary after conversion:- ", (len(payload) + framing.HEADER_SIZE + 1) * 12)
+    nameoffile = input("\nEnter the name of the Stego file after Encoding(with extension):- ")
+    stegapi.embed_text(cover_file_path, payload, out=nameoffile)
+    print("\nStego file has successfully generated")
+
+def encode_txt_data():
+    cover_file_path = input("\nEnter the path to your cover text file:- ")
+    
+    # Check if file exists
+    if not os.path.exists(cover_file_path):
+        print(f"Error: File '{cover_file_path}' not found!")
+        return
+    
+    text1 = input("\nEnter data to be encoded:- ")
+    try:
+        # The cover is only read once; it is too small if it runs out of words
+        txt_encode(text1, cover_file_path)
+    except ValueError as e:
+        print("\n" + str(e))
+        encode_txt_data()
+
+def decode_txt_data():
+    stego = input("\nPlease enter the stego file path to decode the message:- ")
+    
+    # Check if file exists
+    if not os.path.exists(stego):
+        print(f"Error: File '{stego}' not found!")
+        return
+    
+    final = stegapi.extract_text(stego) or b''
+    print("\nMessage after decoding from the stego file:- ", stegapi.decode_text(final))
+
+def txt_steg():
+    while True:
+        print("\n\t\tTEXT STEGANOGRAPHY OPERATIONS") 
+        print("1. Encode the Text message")  
+        print("2. Decode the Text message")  
+        print("3. Exit")  
+        choice1 = int(input("Enter the Choice:"))   
+        if choice1 == 1:
+            encode_txt_data()
+        elif choice1 == 2:
+            decode_txt_data() 
+        elif choice1 == 3:
+            break
+        else:
+            print("Incorrect Choice")
+        print("\n")
+
+def encode_img_data():
+    import cv2
+    img_path = input("\nEnter the path to your cover image file:- ")
+    
+    # Check if file exists
+    if not os.path.exists(img_path):
+        print(f"Error: File '{img_path}' not found!")
+        return
+    
+    data = input("\nEnter the data to be Encoded in Image:- ")    
+    if (len(data) == 0): 
+        raise ValueError('Data entered to be encoded is empty')
+  
+    nameoffile = input("\nEnter the name of the New Image (Stego Image) after Encoding(with extension):- ")
+    
+    # Read from the image header, the pixels are only loaded once the data fits
+    no_of_bytes = stegapi.capacity(img_path, 'image')
+    
+    print("\t\nMaximum bytes to encode in Image:", no_of_bytes)
+    
+    payload = data.encode('utf-8')
+    if(len(payload) > no_of_bytes):
+        raise ValueError("Insufficient bytes Error, Need Bigger Image or give Less Data !!")
+    
+    print("\nThe Length of Binary data", (len(payload) + framing.HEADER_SIZE) * 8)
+    
+    cv2.imwrite(nameoffile, stegapi.embed_image(img_path, payload))
+    print("\nEncoded the data successfully in the Image and the image is successfully saved with name", nameoffile)
+
+def decode_img_data():
+    img_path = input("Enter the path to the stego image you need to decode:- ")
+    
+    # Check if file exists
+    if not os.path.exists(img_path):
+        print(f"Error: File '{img_path}' not found!")
+        return
+    
+    decoded_data = stegapi.extract_image(img_path)
+    if decoded_data is None:
+        print("\nNo hidden data was found in the Image")
+        return
+    print("\n\nThe Encoded data which was hidden in the Image was:--", stegapi.decode_text(decoded_data))
+
+def img_steg():
+    while True:
+        print("\n\t\tIMAGE STEGANOGRAPHY OPERATIONS\n") 
+        print("1. Encode the Text message") 
+        print("2. Decode the Text message") 
+        print("3. Exit")  
+        choice1 = int(input("Enter the Choice: "))   
+        if choice1 == 1:
+            encode_img_data()
+        elif choice1 == 2:
+            decode_img_data()
+        elif choice1 == 3:
+            break
+        else:
+            print("Incorrect Choice")
+        print("\n")
+
+def encode_aud_data():
+    nameoffile = input("Enter path to your cover audio file (with extension):- ")
+    
+    # Check if file exists
+    if not os.path.exists(nameoffile):
+        print(f"Error: File '{nameoffile}' not found!")
+        return
+
+    data = input("\nEnter the secret message:- ")
+
+    payload = data.encode('utf-8')
+    print("\nLength of binary after conversion:- ", (len(payload) + framing.HEADER_SIZE) * 8)
+
+    stegofile = input("\nEnter name of the stego file (with extension):- ")
+    # The cover is copied once and only the samples carrying the message are rewritten
+    stegapi.embed_audio_mapped(nameoffile, payload, out=stegofile)
+    print("\nEncoded the data successfully in the audio file.")    
+
+def decode_aud_data():
+    nameoffile = input("Enter path to the stego audio file to be decoded:- ")
+    
+    # Check if file exists
+    if not os.path.exists(nameoffile):
+        print(f"Error: File '{nameoffile}' not found!")
+        return
+
+    decoded_data = stegapi.extract_audio(nameoffile)
+    if decoded_data is None:
+        print("No hidden data was found in the audio file")
+        return
+    print("The Encoded data was:--", stegapi.decode_text(decoded_data))
+
+def aud_steg():
+    while True:
+        print("\n\t\tAUDIO STEGANOGRAPHY OPERATIONS") 
+        print("1. Encode the Text message")  
+        print("2. Decode the Text message")  
+        print("3. Exit")  
+        choice1 = int(input("Enter the Choice:"))   
+        if choice1 == 1:
+            encode_aud_data()
+        elif choice1 == 2:
+            decode_aud_data()
+        elif choice1 == 3:
+            break
+        else:
+            print("Incorrect Choice")
+        print("\n")
+
+def encode_vid_data():
+    import cv2
+    import video_engine
+    video_path = input("\nEnter the path to your cover video file:- ")
+    
+    # Check if file exists
+    if not os.path.exists(video_path):
+        print(f"Error: File '{video_path}' not found!")
+        return
+        
+    vidcap = cv2.VideoCapture(video_path)
+    max_frame = video_engine.frame_count(vidcap)
+    vidcap.release()
+    print("Total number of Frame in selected Video:", max_frame)
+    print("Enter the frame number where you want to embed data: ")
+    n = int(input())
+    if n < 1 or n > max_frame:
+        print(f"Error: Frame number {n} is outside the video (1 - {max_frame})")
+        return
+    data = input("\nEnter the data to be Encoded in Video:") 
+    if (len(data) == 0): 
+        raise ValueError('Data entered to be encoded is empty')
+    key = input_key()
+    stegofile = input("\nEnter name of the stego video file (.mkv or .avi for lossless output):- ") or 'stego_video.mkv'
+    if not video_engine.is_lossless(stegofile):
+        print("Warning: the output codec is lossy, the hidden data will not survive in the saved file")
+    stegapi.embed_video(video_path, data.encode('utf-8'), key, frame=n, out=stegofile)
+    
+    print("\nEncoded the data successfully in the video file", stegofile)
+
+def decode_vid_data():
+    import cv2
+    import video_engine
+    video_path = input("\nEnter the path to your stego video file:- ")
+    
+    # Check if file exists
+    if not os.path.exists(video_path):
+        print(f"Error: File '{video_path}' not found!")
+        return
+        
+    vidcap = cv2.VideoCapture(video_path)
+    max_frame = video_engine.frame_count(vidcap)
+    vidcap.release()
+    print("Total number of Frame in selected Video:", max_frame)
+    print("Enter the secret frame number from where you want to extract data")
+    n = int(input())
+    if n < 1 or n > max_frame:
+        print(f"Error: Frame number {n} is outside the video (1 - {max_frame})")
+        return
+    final_decoded_msg = stegapi.extract_video(video_path, input_key(), frame=n)
+    if final_decoded_msg is None:
+        print("\nNo hidden data was found in the selected frame")
+        return
+    print("\n\nThe Encoded data which was hidden in the Video was:--\n", stegapi.decode_text(final_decoded_msg))
+
+def encode_vid_data_spread():
+    import cv2
+    import video_engine
+    video_path = input("\nEnter the path to your cover video file:- ")
+    
+    # Check if file exists
+    if not os.path.exists(video_path):
+        print(f"Error: File '{video_path}' not found!")
+        return
+    
+    data_path = input("\nEnter the path to the file with the data to be Encoded in Video:- ")
+    if not os.path.exists(data_path):
+        print(f"Error: File '{data_path}' not found!")
+        return
+    if os.path.getsize(data_path) == 0: 
+        raise ValueError('Data entered to be encoded is empty')
+    key = input_key()
+    
+    vidcap = cv2.VideoCapture(video_path)
+    print("Total number of Frame in selected Video:", video_engine.frame_count(vidcap))
+    print("Payload bytes per frame:", video_engine.frame_capacity(vidcap))
+    vidcap.release()
+    print("Enter the first frame number where you want to embed data: ")
+    start = int(input())
+    print("Enter the frame stride (1 uses every frame): ")
+    stride = int(input())
+    stegofile = input("\nEnter name of the stego video file (.mkv or .avi for lossless output):- ") or 'stego_video.mkv'
+    if not video_engine.is_lossless(stegofile):
+        print("Warning: the output codec is lossy, the hidden data will not survive in the saved file")
+    # The data file is read one frame chunk at a time
+    with open(data_path, "rb") as f:
+        stegapi.embed_video(video_path, f, key, frame=start, stride=stride, out=stegofile)
+    
+    print("\nEncoded the data successfully in the video file", stegofile)
+
+def decode_vid_data_spread():
+    video_path = input("\nEnter the path to your stego video file:- ")
+    
+    # Check if file exists
+    if not os.path.exists(video_path):
+        print(f"Error: File '{video_path}' not found!")
+        return
+    
+    print("Enter the first secret frame number: ")
+    start = int(input())
+    print("Enter the frame stride used when encoding: ")
+    stride = int(input())
+    data = stegapi.extract_video(video_path, input_key(), frame=start, stride=stride)
+    
+    output_path = input("\nEnter the name of the file to save the decoded data to:- ")
+    with open(output_path, "wb") as f:
+        f.write(data)
+    print("\nDecoded", len(data), "bytes from the video and saved them to", output_path)
+
+def vid_steg():
+    while True:
+        print("\n\t\tVIDEO STEGANOGRAPHY OPERATIONS") 
+        print("1. Encode the Text message")  
+        print("2. Decode the Text message")  
+        print("3. Encode a data file across several frames")  
+        print("4. Decode a data file spread across several frames")  
+        print("5. Exit")  
+        choice1 = int(input("Enter the Choice:"))   
+        if choice1 == 1:
+            encode_vid_data()
+        elif choice1 == 2:
+            decode_vid_data()
+        elif choice1 == 3:
+            encode_vid_data_spread()
+        elif choice1 == 4:
+            decode_vid_data_spread()
+        elif choice1 == 5:
+            break
+        else:
+            print("Incorrect Choice")
+        print("\n")
+
+def main():
+    print("\t\t      STEGANOGRAPHY")   
+    while True:  
+        print("\n\t\t\tMAIN MENU\n")  
+        print("1. IMAGE STEGANOGRAPHY {Hiding Text in Image cover file}")  
+        print("2. TEXT STEGANOGRAPHY {Hiding Text in Text cover file}")  
+        print("3. AUDIO STEGANOGRAPHY {Hiding Text in Audio cover file}")
+        print("4. VIDEO STEGANOGRAPHY {Hiding Text in Video cover file}")
+        print("5. Exit\n")  
+        choice1 = int(input("Enter the Choice: "))   
+        if choice1 == 1: 
+            img_steg()
+        elif choice1 == 2:
+            txt_steg()
+        elif choice1 == 3:
+            aud_steg()
+        elif choice1 == 4:
+            vid_steg()
+        elif choice1 == 5:
+            break
+        else:
+            print("Incorrect Choice")
+        print("\n\n")
+
+if __name__ == "__main__":
+    # With arguments the batch command line is used instead of the menus
+    if len(sys.argv) > 1:
+        sys.exit(stegbatch.main(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+import hashlib
+import numpy as np
+
+# Orders in which the channel values of an image carry the payload bits. Every strategy
+# maps payload positions to flat indices into img.reshape(-1); embedder and extractor
+# both slice the map (order[first:stop]) and apply the indices with fancy indexing. Only
+# the slice that is asked for is computed, so the cost follows the payload size, not the
+# image size. "sequential" is plain raster order R, G, B, (0,0) first, which needs no map
+# at all: index_map returns None and the engine keeps slicing.
+STRATEGIES = ('sequential', 'random', 'stride')
+# Interleaving step for "stride"; co-prime with the 3 channels so every channel is used
+DEFAULT_STRIDE = 7
+# Feistel rounds of the keyed permutation behind "random"
+ROUNDS = 6
+
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+def _digest(key):
+    key = key.encode('utf-8') if isinstance(key, str) else bytes(key)
+    return hashlib.sha256(key).digest()
+
+def _seed(digest):
+    return np.random.SeedSequence(np.frombuffer(digest, dtype='<u4').tolist())
+
+def _positions(item, size):
+    if not isinstance(item, slice):
+        raise TypeError("Pixel orders are read in slices")
+    return np.arange(*item.indices(size), dtype=np.uint64)
+
+def _mix(x):
+    # splitmix64 finalizer, wrapping uint64 arithmetic
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+class RandomOrder:
+    # Keyed bijection over [0, size): a balanced Feistel network over the smallest even
+    # number of bits that covers size, with cycle-walking for the values that land past
+    # the end. The domain is less than 4 * size, so few values need a second walk.
+    def __init__(self, size, digest):
+        self.size = size
+        self.half = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.mask = np.uint64((1 << self.half) - 1)
+        self.keys = _seed(digest).generate_state(ROUNDS, np.uint64)
+
+    def __len__(self):
+        return self.size
+
+    def _permute(self, x):
+        shift = np.uint64(self.half)
+        left, right = x >> shift, x & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (_mix(right ^ key) & self.mask)
+        return (left << shift) | right
+
+    def __getitem__(self, item):
+        index = self._permute(_positions(item, self.size))
+        outside = np.flatnonzero(index >= self.size)
+        while len(outside):
+            index[outside] = self._permute(index[outside])
+            outside = outside[index[outside] >= self.size]
+        return index.astype(np.intp)
+
+class StrideOrder:
+    # 0, s, 2s, ... then 1, 1 + s, ... so a short payload is spread over the whole image.
+    # Row r holds the indices r, r + s, ...; the first size % s rows have one more entry.
+    def __init__(self, size, stride):
+        self.size = size
+        self.stride = stride
+        self.row, self.long_rows = divmod(size, stride)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, item):
+        p = _positions(item, self.size).astype(np.int64)
+        split = self.long_rows * (self.row + 1)
+        long_part = p < split
+        r = np.empty_like(p)
+        col = np.empty_like(p)
+        r[long_part], col[long_part] = np.divmod(p[long_part], self.row + 1)
+        if self.row:
+            rest, col[~long_part] = np.divmod(p[~long_part] - split, self.row)
+            r[~long_part] = rest + self.long_rows
+        return (r + self.stride * col).astype(np.intp)
+
+def index_map(strategy, size, key=None, stride=DEFAULT_STRIDE):
+    # Returns the map for an image with `size` channel values, or None for the sequential
+    # order
+    if strategy == 'sequential':
+        return None
+    if strategy == 'random':
+        if not key:
+            raise ValueError("The random pixel order needs a key")
+        return RandomOrder(size, _digest(key))
+    if strategy == 'stride':
+        if stride < 1:
+            raise ValueError("Pixel stride must be at least 1")
+        return StrideOrder(size, stride)
+    raise ValueError(f"Unknown pixel order '{strategy}', use one of {', '.join(STRATEGIES)}")
@@ -0,0 +1,56 @@
+import numpy as np
+
+def key_bytes(key):
+    # Text keys are used as their character codes, like preparing_key_array always did
+    if isinstance(key, str):
+        return bytes(ord(c) & 0xFF for c in key)
+    return bytes(key)
+
+def ksa(key):
+    key = key_bytes(key)
+    if len(key) == 0:
+        raise ValueError("Encryption key must not be empty")
+    S = bytearray(range(256))
+    key_length = len(key)
+    j = 0
+    for i in range(256):
+        j = (j + S[i] + key[i % key_length]) & 0xFF
+        S[i], S[j] = S[j], S[i]
+    return S
+
+def prga(S, n, i=0, j=0):
+    # Fills a preallocated buffer with n keystream bytes, permuting S in place.
+    # Returns the keystream together with the i, j state to continue from.
+    out = bytearray(n)
+    for k in range(n):
+        i = (i + 1) & 0xFF
+        si = S[i]
+        j = (j + si) & 0xFF
+        sj = S[j]
+        S[i] = sj
+        S[j] = si
+        out[k] = S[(si + sj) & 0xFF]
+    return out, i, j
+
+def xor_bytes(data, keystream):
+    data = np.frombuffer(data, dtype=np.uint8)
+    return np.bitwise_xor(data, np.frombuffer(keystream, dtype=np.uint8)[:len(data)]).tobytes()
+
+class RC4:
+    # Streaming cipher: the keystream continues across calls, so a payload can be
+    # processed chunk by chunk and gives the same result as one call over the whole of it
+    def __init__(self, key):
+        self.S = ksa(key)
+        self.i = 0
+        self.j = 0
+
+    def keystream(self, n):
+        out, self.i, self.j = prga(self.S, n, self.i, self.j)
+        return out
+
+    def process(self, data):
+        return xor_bytes(data, self.keystream(len(data)))
+
+def crypt(key, data):
+    # RC4 is symmetric, the same call encrypts and decrypts
+    return RC4(key).process(data)
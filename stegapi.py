@@ -0,0 +1,327 @@
+import io
+import os
+import shutil
+import tempfile
+import wave
+import zlib
+from contextlib import contextmanager
+import numpy as np
+import audio_engine
+import framing
+import image_header
+import lsb_engine
+import pixel_order
+import rc4
+import text_engine
+
+# Non-interactive entry points for all four media types. Covers and stego media can be
+# paths or in-memory buffers; payloads are bytes, str (encoded as UTF-8) or a binary file
+# object, which is read in blocks so that large files never have to fit in memory. When a
+# key is given the payload is RC4-encrypted before embedding and decrypted after extraction.
+# Extraction returns None when no hidden payload is found.
+# cv2 and video_engine are imported inside the image and video functions, so text and
+# audio work never loads OpenCV. The optional progress(done, total) callback is handed to
+# the engines; raising from it cancels the operation. With `compression` (zlib, lzma or
+# bz2) the payload is compressed before encryption; the method is recorded in the frame
+# header flags, so extraction decompresses without being told.
+
+def _is_path(obj):
+    return isinstance(obj, (str, os.PathLike))
+
+# Prepared payloads are kept in memory up to this size and spill to a temporary file beyond it
+SPOOL_MEMORY = 16 << 20
+
+def _payload_source(payload):
+    if isinstance(payload, str):
+        return io.BytesIO(payload.encode('utf-8'))
+    if hasattr(payload, 'read'):
+        return payload
+    return io.BytesIO(payload)
+
+def decode_text(data):
+    # Typed messages are hidden as UTF-8; stego files from before that carry one byte per
+    # character and are read as Latin-1 when they are not valid UTF-8
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+def _crypt(data, key):
+    if data is None or not key:
+        return data
+    return rc4.crypt(key, data)
+
+def _spool(source, key, compressor):
+    # One pass over the source: compress, encrypt and checksum block by block. Compressed
+    # data is followed by the plain length (framing.PLAIN_LENGTH). Returns the prepared
+    # framing.Payload and the number of plain bytes that were read.
+    spool = tempfile.SpooledTemporaryFile(SPOOL_MEMORY)
+    cipher = rc4.RC4(key) if key else None
+    crc = 0
+    read = 0
+
+    def write(block):
+        nonlocal crc
+        if cipher:
+            block = cipher.process(block)
+        crc = zlib.crc32(block, crc)
+        spool.write(block)
+
+    try:
+        for block in iter(lambda: source.read(framing.STREAM_CHUNK), b''):
+            read += len(block)
+            write(compressor.compress(block) if compressor else block)
+        if compressor:
+            write(compressor.flush())
+            write(framing.PLAIN_LENGTH.pack(read))
+    except BaseException:
+        spool.close()
+        raise
+    length = spool.tell()
+    spool.seek(0)
+    return framing.Payload(spool, length, crc), read
+
+def _pack(payload, key, compression):
+    # Returns a framing.Payload: compressed first, since ciphertext does not compress. A
+    # payload that does not get smaller is stored as it is, if its source can be read twice.
+    # The embed functions use it in a with block, which closes the spooled copy.
+    source = _payload_source(payload)
+    start = source.tell() if source.seekable() else None
+    packed, read = _spool(source, key, framing.compressor(compression))
+    if compression is None:
+        return packed
+    if packed.length >= read and start is not None:
+        packed.source.close()
+        source.seek(start)
+        return _spool(source, key, None)[0]
+    packed.flags = framing.COMPRESSION_FLAGS[compression]
+    return packed
+
+def _unpack(found, key):
+    # `found` is (flags, data) from an engine, or None
+    if found is None:
+        return None
+    flags, data = found
+    return framing.decompress(_crypt(data, key), flags)
+
+@contextmanager
+def _opened(obj, mode, **kwargs):
+    if _is_path(obj):
+        with open(obj, mode, **kwargs) as f:
+            yield f
+    else:
+        yield obj
+
+@contextmanager
+def _staged_output(out):
+    # An output path is written under a temporary name (keeping the extension, which picks
+    # the video codec) and only moved into place once the embed has finished, so a failed
+    # or cancelled job never leaves a half-written file behind
+    if not _is_path(out):
+        yield out
+        return
+    root, ext = os.path.splitext(os.fspath(out))
+    part = f"{root}.part{ext}"
+    try:
+        yield part
+    except BaseException:
+        if os.path.exists(part):
+            os.remove(part)
+        raise
+    os.replace(part, out)
+
+def _binary_source(obj):
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return io.BytesIO(obj)
+    if _is_path(obj):
+        return os.fspath(obj)
+    return obj
+
+# Image
+
+def load_image(cover):
+    import cv2
+    if isinstance(cover, np.ndarray):
+        return cover
+    if _is_path(cover):
+        img = cv2.imread(os.fspath(cover))
+    else:
+        data = cover.read() if hasattr(cover, 'read') else cover
+        img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("Could not load the image")
+    return img
+
+def _pixel_order(img, order, key, stride):
+    # "random" is seeded with the encryption key, so the same key is needed to find the bits
+    return pixel_order.index_map(order, img.size, key, stride)
+
+def embed_image(cover, payload, key=None, progress=None, order='sequential', stride=pixel_order.DEFAULT_STRIDE, depth=1,
+                compression=None):
+    # `order` picks the channel values that carry the bits (sequential, random or stride) and
+    # `depth` how many low bits of each of them are used (1 - 4)
+    img = load_image(cover)
+    if img is cover:
+        img = img.copy()
+    index = _pixel_order(img, order, key, stride)
+    # progress is reported per block in pixels, so a cancel lands between blocks
+    with _pack(payload, key, compression) as data:
+        return lsb_engine.embed_payload(img, data, index, depth, progress)
+
+def extract_image(stego, key=None, progress=None, order='sequential', stride=pixel_order.DEFAULT_STRIDE, depth=1):
+    img = load_image(stego)
+    found = lsb_engine.extract_framed(img, _pixel_order(img, order, key, stride), depth, progress)
+    return _unpack(found, key)
+
+# Text
+
+def embed_text(cover, payload, key=None, out=None, progress=None, compression=None):
+    # Returns the stego text, or writes it to `out` (path or text file object)
+    with _pack(payload, key, compression) as data, _opened(cover, 'r', encoding='utf-8') as src:
+        if out is None:
+            buf = io.StringIO()
+            text_engine.embed(src, buf, data, progress)
+            return buf.getvalue()
+        # Capacity is only known once the whole cover has streamed through
+        with _staged_output(out) as target, _opened(target, 'w', encoding='utf-8') as dst:
+            text_engine.embed(src, dst, data, progress)
+    return out
+
+def extract_text(stego, key=None, progress=None):
+    with _opened(stego, 'r', encoding='utf-8') as src:
+        found = text_engine.extract_framed(src, progress=progress)
+    return _unpack(found, key)
+
+# Audio
+
+def embed_audio(cover, payload, key=None, out=None, progress=None, compression=None):
+    # Returns the stego WAV as bytes, or writes it to `out` (path or binary file object)
+    with _pack(payload, key, compression) as data, wave.open(_binary_source(cover), 'rb') as song:
+        if out is None:
+            buf = io.BytesIO()
+            audio_engine.write_stego(buf, song, data, progress=progress)
+            return buf.getvalue()
+        with _staged_output(out) as target:
+            audio_engine.write_stego(_binary_source(target), song, data, progress=progress)
+    return out
+
+def embed_audio_mapped(cover, payload, key=None, out=None, progress=None, compression=None):
+    # Path-only variant of embed_audio for uncompressed PCM WAV: the cover is copied to `out`
+    # once (or changed in place when `out` is None) and only the bytes that carry the
+    # payload are rewritten through a memory map
+    with _pack(payload, key, compression) as data:
+        # Checked before the copy; the copy has its data chunk at the same offset
+        chunk = audio_engine.mapped_chunk(cover, data)
+        if out is None:
+            audio_engine.embed_mapped(cover, data, progress, chunk=chunk)
+            return cover
+        with _staged_output(out) as target:
+            shutil.copyfile(cover, target)
+            audio_engine.embed_mapped(target, data, progress, chunk=chunk)
+    return out
+
+def extract_audio(stego, key=None, progress=None):
+    with wave.open(_binary_source(stego), 'rb') as song:
+        return _unpack(audio_engine.read_framed(song, progress=progress), key)
+
+# Video
+
+def _open_video(cover):
+    import cv2
+    import video_engine
+    if _is_path(cover):
+        cap = cv2.VideoCapture(os.fspath(cover))
+        if not cap.isOpened():
+            raise ValueError(f"Could not open the video '{cover}'")
+        return cap
+    return video_engine.FrameSource(cover)
+
+def embed_video(cover, payload, key=None, frame=1, stride=None, out=None, progress=None, compression=None):
+    # Embeds into frame `frame` (1-based), or spreads the payload over frame, frame + stride, ...
+    # when a stride is given. Returns the list of stego frames, or writes them to the video
+    # file `out` (use .mkv/.avi for lossless FFV1 output).
+    import cv2
+    import video_engine
+    with _pack(payload, key, compression) as data:
+        cap = _open_video(cover)
+        try:
+            if stride is None:
+                # Checked before any frame is copied, the payload only goes in once the
+                # copy reaches the selected frame
+                max_frame = video_engine.frame_count(cap)
+                if frame < 1 or frame > max_frame:
+                    raise ValueError(f"Frame number {frame} is outside the video (1 - {max_frame})")
+                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                if data.length > lsb_engine.capacity_for_shape((height, width, 3)):
+                    raise ValueError("Insufficient bytes Error, Need Bigger Image or give Less Data !!")
+            with _staged_output(out) as target:
+                writer = video_engine.FrameSink() if out is None else video_engine.open_writer(os.fspath(target), cap)
+                try:
+                    if stride is None:
+                        changed = video_engine.copy_with_frame(cap, writer, frame,
+                                                               lambda f: lsb_engine.embed_payload(f, data), progress)
+                        # The frame count comes from container metadata, which can overstate it
+                        if changed is None:
+                            raise ValueError(f"Video ended before frame {frame}")
+                    else:
+                        video_engine.embed_spread(cap, writer, data, frame, stride, progress=progress)
+                finally:
+                    writer.release()
+        finally:
+            cap.release()
+    return writer.frames if out is None else out
+
+def extract_video(stego, key=None, frame=1, stride=None, progress=None):
+    import video_engine
+    cap = _open_video(stego)
+    try:
+        if stride is None:
+            selected = video_engine.read_frame(cap, frame)
+            if selected is None:
+                raise ValueError(f"Frame number {frame} is outside the video")
+            found = lsb_engine.extract_framed(selected)
+            if progress:
+                progress(1, 1)
+        else:
+            found = video_engine.extract_spread_framed(cap, frame, stride, progress=progress)
+    finally:
+        cap.release()
+    return _unpack(found, key)
+
+# Capacity
+
+def capacity(path, mode, frame=1, stride=None, depth=1):
+    # Payload bytes that fit into the cover at `path` (RC4 keeps the length, so a key does
+    # not change it). Only headers and metadata are read: image dimensions from the file
+    # header, the WAV data chunk size, the video frame count and size from the container
+    # and a block-wise word count for text. `frame` and `stride` match embed_video, `depth`
+    # matches embed_image. The count is in stored bytes, so with compression a larger
+    # plain payload may fit.
+    if mode == 'image':
+        size = image_header.read_size(path)
+        if size is None:
+            # Not a format the header reader knows; fall back to decoding it
+            return lsb_engine.capacity_bytes(load_image(path), depth)
+        width, height = size
+        return lsb_engine.capacity_for_shape((height, width, 3), depth)
+    if mode == 'text':
+        with open(path, 'r', encoding='utf-8') as f:
+            return text_engine.capacity_bytes(text_engine.count_words(f))
+    if mode == 'audio':
+        return audio_engine.capacity_bytes_file(path)
+    if mode == 'video':
+        import cv2
+        import video_engine
+        cap = _open_video(path)
+        try:
+            if stride is None:
+                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                return lsb_engine.capacity_for_shape((height, width, 3))
+            frames = video_engine.frame_count(cap)
+            chunks = (frames - frame) // stride + 1 if 1 <= frame <= frames else 0
+            return chunks * video_engine.frame_capacity(cap)
+        finally:
+            cap.release()
+    raise ValueError(f"Unknown cover mode '{mode}', use image, text, audio or video")
@@ -0,0 +1,252 @@
+import argparse
+import csv
+import hashlib
+import hmac
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import framing
+import lsb_engine
+import pixel_order
+import stegapi
+
+# Non-interactive batch front end, e.g.
+#   python multimedia_steg.py image embed --covers covers/ --payloads manifest.csv --out stego/ --jobs 8
+#   python multimedia_steg.py image extract --covers stego/ --payloads manifest.csv --out decoded/ --jobs 8
+# Every finished job is appended to a JSONL report as soon as it completes. Covers that
+# already have an "ok" entry with the same settings (options and key) in the report are
+# skipped, so an interrupted run is resumed by starting the same command again, while a
+# run with other settings redoes them. Keys are recorded as HMAC tags under a random salt
+# that is stored in the report.
+
+MEDIA = ('image', 'text', 'audio', 'video')
+COVER_EXTENSIONS = {
+    'image': ('.png', '.bmp', '.tif', '.tiff', '.jpg', '.jpeg'),
+    'text': ('.txt',),
+    'audio': ('.wav',),
+    'video': ('.mkv', '.avi', '.mp4', '.mov'),
+}
+# Stego files are always written in a format that keeps the LSBs intact
+OUTPUT_EXTENSIONS = {'image': '.png', 'text': '.txt', 'audio': '.wav', 'video': '.mkv'}
+EXTRACT_EXTENSION = '.bin'
+REPORT_NAME = 'report.jsonl'
+# Random salt of the key tags, written to the report when it is created
+SALT_BYTES = 16
+# Options that change the result of each action, recorded with every job
+SETTINGS = {
+    'embed': ('frame', 'stride', 'order', 'pixel_stride', 'depth', 'compress'),
+    'extract': ('frame', 'stride', 'order', 'pixel_stride', 'depth'),
+}
+
+def output_path(media, action, cover, out_dir):
+    # A cover that is not already in the output format keeps its extension in the stego
+    # name (a.jpg -> a.jpg.png), so a.png and a.jpg do not both become a.png
+    name = os.path.basename(cover)
+    if action == 'embed':
+        stem, ext = os.path.splitext(name)
+        if ext.lower() == OUTPUT_EXTENSIONS[media]:
+            return os.path.join(out_dir, stem + OUTPUT_EXTENSIONS[media])
+        return os.path.join(out_dir, name + OUTPUT_EXTENSIONS[media])
+    return os.path.join(out_dir, name + EXTRACT_EXTENSION)
+
+def check_outputs(jobs, outputs):
+    # Two jobs writing one file would race and silently lose a result
+    seen = {}
+    for job, out in zip(jobs, outputs):
+        key = os.path.normcase(os.path.abspath(out))
+        if key in seen:
+            raise SystemExit(f"{seen[key]} and {job['cover']} would both be written to {out}")
+        seen[key] = job['cover']
+
+def list_covers(media, covers_dir):
+    names = sorted(os.listdir(covers_dir))
+    return [os.path.join(covers_dir, name) for name in names
+            if name.lower().endswith(COVER_EXTENSIONS[media]) and os.path.isfile(os.path.join(covers_dir, name))]
+
+def read_manifest(path, covers_dir, media, action='embed'):
+    # CSV with a "cover" column (relative to the covers directory) and either a "payload"
+    # column (file relative to the manifest) or a "message" column; "key" is optional.
+    # For extract only cover and key are used, so the manifest of an embed run decodes its
+    # stego files: a cover that is not in the directory is looked up under its stego name.
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            if not row.get('cover'):
+                raise ValueError(f"{path}:{line}: missing cover")
+            job = {'cover': os.path.join(covers_dir, row['cover']), 'key': row.get('key') or None}
+            if action == 'extract':
+                if not os.path.exists(job['cover']):
+                    job['cover'] = output_path(media, 'embed', job['cover'], covers_dir)
+            elif row.get('payload'):
+                job['payload'] = os.path.join(base, row['payload'])
+            elif row.get('message') is not None:
+                job['message'] = row['message']
+            else:
+                raise ValueError(f"{path}:{line}: needs a payload or a message")
+            jobs.append(job)
+    return jobs
+
+def key_id(key, salt):
+    # Tells keys apart in the report without writing the key itself; the salt is per report
+    if not key:
+        return None
+    return hmac.new(salt, key.encode('utf-8'), hashlib.sha256).hexdigest()[:16]
+
+def job_settings(action, options, key, salt):
+    settings = {name: options[name] for name in SETTINGS[action]}
+    settings['key'] = key_id(key, salt)
+    return settings
+
+def read_report(path):
+    # Returns the report salt (None for a new report) and the (media, action, cover,
+    # settings) of the jobs that already succeeded; a line cut short by an interruption is
+    # ignored, as are entries from before settings were recorded
+    salt = None
+    done = set()
+    if not os.path.exists(path):
+        return salt, done
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'salt' in record and salt is None:
+                salt = bytes.fromhex(record['salt'])
+            elif record.get('status') == 'ok' and 'settings' in record:
+                settings = json.dumps(record['settings'], sort_keys=True)
+                done.add((record['media'], record['action'], record['cover'], settings))
+    return salt, done
+
+def _embed(media, cover, payload, key, out, options):
+    if media == 'image':
+        import cv2
+        img = stegapi.embed_image(cover, payload, key, order=options['order'], stride=options['pixel_stride'],
+                                  depth=options['depth'], compression=options['compress'])
+        if not cv2.imwrite(out, img):
+            raise ValueError(f"Could not write '{out}'")
+    elif media == 'text':
+        stegapi.embed_text(cover, payload, key, out=out, compression=options['compress'])
+    elif media == 'audio':
+        stegapi.embed_audio_mapped(cover, payload, key, out=out, compression=options['compress'])
+    else:
+        stegapi.embed_video(cover, payload, key, frame=options['frame'], stride=options['stride'], out=out,
+                            compression=options['compress'])
+
+def _extract(media, cover, key, options):
+    if media == 'image':
+        return stegapi.extract_image(cover, key, order=options['order'], stride=options['pixel_stride'],
+                                     depth=options['depth'])
+    if media == 'text':
+        return stegapi.extract_text(cover, key)
+    if media == 'audio':
+        return stegapi.extract_audio(cover, key)
+    return stegapi.extract_video(cover, key, frame=options['frame'], stride=options['stride'])
+
+def run_job(media, action, job, out, options):
+    # Runs in a worker process; failures are reported instead of raised so that one bad
+    # cover does not stop the batch. `options` holds frame, stride, order, pixel_stride, depth
+    # and compress.
+    record = {'media': media, 'action': action, 'cover': job['cover'], 'output': out, 'settings': job['settings']}
+    started = time.perf_counter()
+    try:
+        if action == 'embed':
+            if 'payload' in job:
+                # Payload files are streamed into the cover instead of being read whole
+                with open(job['payload'], 'rb') as f:
+                    _embed(media, job['cover'], f, job['key'], out, options)
+                    record['bytes'] = f.tell()
+            else:
+                payload = job['message'].encode('utf-8')
+                _embed(media, job['cover'], payload, job['key'], out, options)
+                record['bytes'] = len(payload)
+        else:
+            data = _extract(media, job['cover'], job['key'], options)
+            if data is None:
+                raise ValueError("No hidden data was found")
+            with open(out, 'wb') as f:
+                f.write(data)
+            record['bytes'] = len(data)
+        record['status'] = 'ok'
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = f"{type(e).__name__}: {e}"
+    record['seconds'] = round(time.perf_counter() - started, 6)
+    return record
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='multimedia_steg.py',
+                                     description="Embed or extract hidden data for a whole directory of covers.")
+    parser.add_argument('media', choices=MEDIA)
+    parser.add_argument('action', choices=('embed', 'extract'))
+    parser.add_argument('--covers', required=True, help="directory with the cover (or stego) files")
+    parser.add_argument('--out', required=True, help="directory for the stego files or the extracted payloads")
+    payloads = parser.add_mutually_exclusive_group()
+    payloads.add_argument('--payloads', help="CSV manifest with cover,payload (or cover,message) columns and an "
+                          "optional key column; extract only uses cover and key")
+    payloads.add_argument('--payload', help="file embedded into every cover in --covers")
+    parser.add_argument('--key', help="RC4 key for every job (a manifest key column overrides it)")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--report', help=f"JSONL report (default: <out>/{REPORT_NAME})")
+    parser.add_argument('--frame', type=int, default=1, help="video: frame number, or first frame when spreading")
+    parser.add_argument('--stride', type=int, default=None, help="video: spread the payload over every stride-th frame")
+    parser.add_argument('--order', choices=pixel_order.STRATEGIES, default='sequential',
+                        help="image: channel values that carry the bits (random is seeded with the key)")
+    parser.add_argument('--pixel-stride', type=int, default=pixel_order.DEFAULT_STRIDE,
+                        help=f"image: interleaving step for --order stride (default {pixel_order.DEFAULT_STRIDE})")
+    parser.add_argument('--depth', type=int, default=1, choices=range(1, lsb_engine.MAX_DEPTH + 1),
+                        help="image: low bits used in every channel value (default 1)")
+    parser.add_argument('--compress', choices=tuple(framing.COMPRESSION_FLAGS), default=None,
+                        help="embed: compress payloads first (extraction detects it on its own)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.payloads:
+        jobs = read_manifest(args.payloads, args.covers, args.media, args.action)
+        for job in jobs:
+            job['key'] = job['key'] or args.key
+    else:
+        if args.action == 'embed' and not args.payload:
+            raise SystemExit("embed needs --payloads or --payload")
+        jobs = [{'cover': cover, 'key': args.key} for cover in list_covers(args.media, args.covers)]
+        if args.payload:
+            for job in jobs:
+                job['payload'] = args.payload
+
+    options = {'frame': args.frame, 'stride': args.stride, 'order': args.order, 'pixel_stride': args.pixel_stride,
+               'depth': args.depth, 'compress': args.compress}
+    for job in jobs:
+        job['output'] = output_path(args.media, args.action, job['cover'], args.out)
+    check_outputs(jobs, [job['output'] for job in jobs])
+
+    os.makedirs(args.out, exist_ok=True)
+    report_path = args.report or os.path.join(args.out, REPORT_NAME)
+    salt, done = read_report(report_path)
+    new_salt = salt is None
+    if new_salt:
+        salt = os.urandom(SALT_BYTES)
+    for job in jobs:
+        job['settings'] = job_settings(args.action, options, job['key'], salt)
+    todo = [job for job in jobs
+            if (args.media, args.action, job['cover'], json.dumps(job['settings'], sort_keys=True)) not in done]
+    print(f"{len(jobs)} covers, {len(jobs) - len(todo)} already done, {len(todo)} to process")
+
+    failed = 0
+    with open(report_path, 'a', encoding='utf-8') as report, ProcessPoolExecutor(args.jobs) as pool:
+        if new_salt:
+            report.write(json.dumps({'salt': salt.hex()}) + "\n")
+            report.flush()
+        futures = [pool.submit(run_job, args.media, args.action, job, job['output'], options) for job in todo]
+        for future in as_completed(futures):
+            record = future.result()
+            report.write(json.dumps(record) + "\n")
+            report.flush()
+            if record['status'] != 'ok':
+                failed += 1
+                print(f"{record['cover']}: {record['error']}", file=sys.stderr)
+    print(f"{len(todo) - failed} succeeded, {failed} failed, report written to {report_path}")
+    return 1 if failed else 0
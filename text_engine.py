@@ -0,0 +1,149 @@
+import re
+import numpy as np
+import framing
+
+ZWC = {"00": u'\u200C', "01": u'\u202C', "11": u'\u202D', "10": u'\u200E'}
+
+# Every payload byte becomes one 12-bit group (4-bit case tag + 8-bit code) hidden behind a
+# word of the cover as six zero-width characters; this group marks the end of the payload
+END_GROUP = "111111111111"
+
+# Bulk decoding: everything that is not a zero-width character is dropped, the rest is
+# mapped to base-4 digits (two bits each) and every six digits form one 12-bit group
+NOT_ZWC = re.compile(u'[^\u200C\u202C\u202D\u200E]+')
+ZWC_DIGITS = str.maketrans({u'\u200C': "0", u'\u202C': "1", u'\u202D': "3", u'\u200E': "2"})
+PLACE_VALUES = 4 ** np.arange(5, -1, -1)
+END_VALUE = int(END_GROUP, 2)
+
+# Characters read from the cover per step, and words collected before each write
+READ_BLOCK = 1 << 16
+WRITE_BATCH = 4096
+
+def _group_bits(t):
+    # The original per-character transform, only run while building the codebook below
+    if(t >= 32 and t <= 64):
+        return "0011" + format((t + 48) ^ 170, "08b")       #170: 10101010
+    return "0110" + format(((t - 48) & 0xFF) ^ 170, "08b")
+
+def _build_codebook():
+    encode = tuple("".join(ZWC[bits[j:j+2]] for j in range(0, 12, 2)) for bits in map(_group_bits, range(256)))
+    return encode, {glyphs: t for t, glyphs in enumerate(encode)}
+
+# Payload byte -> six zero-width glyphs, and glyph sextet -> payload byte
+ENCODE_TABLE, DECODE_GLYPHS = _build_codebook()
+END_GLYPHS = ZWC["11"] * 6
+
+def iter_words(cover, block_size=READ_BLOCK):
+    # Reads the cover lazily in fixed-size blocks, so even a cover without line breaks
+    # never has to be held in memory; a word cut by a block boundary is carried over
+    tail = ''
+    while True:
+        block = cover.read(block_size)
+        if not block:
+            break
+        block = tail + block
+        words = block.split()
+        tail = words.pop() if words and not block[-1].isspace() else ''
+        yield from words
+    if tail:
+        yield tail
+
+def iter_hidden(blocks):
+    # Six zero-width characters per payload byte, then the end group
+    for block in blocks:
+        yield from map(ENCODE_TABLE.__getitem__, block)
+    yield END_GLYPHS
+
+def count_words(cover, block_size=READ_BLOCK):
+    # Same word boundaries as iter_words, but counted per block instead of word by word;
+    # a word that runs across a block boundary is only counted once
+    count = 0
+    inside_word = False
+    while True:
+        block = cover.read(block_size)
+        if not block:
+            break
+        count += len(block.split())
+        if inside_word and not block[0].isspace():
+            count -= 1
+        inside_word = not block[-1].isspace()
+    return count
+
+def capacity_bytes(word_count):
+    # One word per byte of the framed payload plus one for the end group
+    return max(0, word_count - 1 - framing.HEADER_SIZE)
+
+def embed(cover, out, payload, progress=None, flags=0):
+    # Single streaming pass: words are copied to `out` in batches with the hidden groups of
+    # the framed payload appended to the first len(framed) + 1 of them, as space-separated
+    # words like before. Raises ValueError at the end of the cover if it ran out of words.
+    # progress(done, total) is called after every batch with the bytes hidden so far.
+    # `payload` is bytes or a framing.Payload, which is read in blocks as the words go by.
+    payload = framing.as_payload(payload, flags)
+    hidden = iter_hidden(framing.iter_framed(payload))
+    pending = next(hidden)
+    used = 0
+    batch = []
+    for word in iter_words(cover):
+        if pending is not None:
+            batch.append(word + pending + " ")
+            pending = next(hidden, None)
+            used += 1
+        else:
+            batch.append(word + " ")
+        if len(batch) >= WRITE_BATCH:
+            out.write("".join(batch))
+            batch.clear()
+            if progress:
+                progress(min(used, len(payload)), len(payload))
+    out.write("".join(batch))
+    if pending is not None:
+        raise ValueError("String is too big please reduce string size")
+
+def _build_decode_table():
+    # 12-bit group -> payload byte, -1 for groups that are not in the codebook
+    table = np.full(4096, -1, dtype=np.int16)
+    for glyphs, t in DECODE_GLYPHS.items():
+        table[int(glyphs.translate(ZWC_DIGITS), 4)] = t
+    return table
+
+DECODE_TABLE = _build_decode_table()
+
+def extract(stego, block_size=READ_BLOCK, progress=None):
+    # Returns the hidden bytes (empty when there are none)
+    found = extract_framed(stego, block_size, progress)
+    return b'' if found is None else found[1]
+
+def extract_framed(stego, block_size=READ_BLOCK, progress=None):
+    # Returns (flags, payload), or None when nothing is hidden. Stego text from before the
+    # framed format carries the raw message, which comes back with flags 0.
+    # progress(done, None) is called after every block with the characters read so far
+    final = bytearray()
+    carry = ""
+    read = 0
+    while True:
+        block = stego.read(block_size)
+        if not block:
+            break
+        read += len(block)
+        if progress:
+            progress(read, None)
+        digits = carry + NOT_ZWC.sub("", block).translate(ZWC_DIGITS)
+        usable = len(digits) - len(digits) % 6
+        carry = digits[usable:]
+        if not usable:
+            continue
+        symbols = np.frombuffer(digits[:usable].encode('ascii'), dtype=np.uint8) - ord("0")
+        groups = symbols.reshape(-1, 6) @ PLACE_VALUES
+        end = np.flatnonzero(groups == END_VALUE)
+        if len(end):
+            groups = groups[:end[0]]
+        decoded = DECODE_TABLE[groups]
+        final += decoded[decoded >= 0].astype(np.uint8).tobytes()
+        if len(end):
+            # Stop reading at the end group
+            break
+    found = framing.unpack(final)
+    if found is None and final:
+        return 0, bytes(final)
+    return found
@@ -0,0 +1,238 @@
+import os
+import struct
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import cv2
+import framing
+import lsb_engine
+
+# FFV1 is lossless, so the LSBs written into a frame survive in the file itself.
+# Any other extension falls back to the old lossy XVID writer.
+LOSSLESS_CODECS = {'.mkv': 'FFV1', '.avi': 'FFV1'}
+LOSSY_CODEC = 'XVID'
+DEFAULT_FPS = 25.0
+
+# Every frame of a spread payload carries its chunk index and the total number of chunks
+CHUNK_HEADER = struct.Struct('>II')
+
+# The long-running functions take an optional progress(done, total) callback, called with
+# the frames handled so far; an exception raised by it aborts the operation
+
+def is_lossless(path):
+    return os.path.splitext(path)[1].lower() in LOSSLESS_CODECS
+
+def open_writer(path, cap):
+    # Keeps the frame rate and frame size of the source video
+    codec = LOSSLESS_CODECS.get(os.path.splitext(path)[1].lower(), LOSSY_CODEC)
+    fps = cap.get(cv2.CAP_PROP_FPS) or DEFAULT_FPS
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    out = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*codec), fps, size)
+    if not out.isOpened():
+        raise ValueError(f"Could not open '{path}' for writing with the {codec} codec")
+    return out
+
+class FrameSource:
+    # Minimal cv2.VideoCapture stand-in over a sequence of in-memory frames
+    def __init__(self, frames, fps=DEFAULT_FPS):
+        self.frames = list(frames)
+        self.fps = fps
+        self.pos = 0
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return len(self.frames)
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.pos
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if not self.frames:
+            return 0
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.frames[0].shape[1]
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.frames[0].shape[0]
+        return 0
+
+    def set(self, prop, value):
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        self.pos = int(value)
+        return True
+
+    def grab(self):
+        if self.pos >= len(self.frames):
+            return False
+        self.pos += 1
+        return True
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return True, self.frames[self.pos - 1].copy()
+
+    def release(self):
+        pass
+
+class FrameSink:
+    # Collects written frames in memory instead of encoding them
+    def __init__(self):
+        self.frames = []
+
+    def write(self, frame):
+        self.frames.append(frame)
+
+    def release(self):
+        pass
+
+def frame_count(cap):
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if count > 0:
+        return count
+    # The container does not report a frame count; grab (without decoding) and count instead
+    pos = cap.get(cv2.CAP_PROP_POS_FRAMES)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    count = 0
+    while cap.grab():
+        count += 1
+    cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
+    return count
+
+def read_frame(cap, n):
+    # Frame numbers are 1-based, as in the menus
+    if not cap.set(cv2.CAP_PROP_POS_FRAMES, n - 1):
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        for _ in range(n - 1):
+            if not cap.grab():
+                return None
+    ret, frame = cap.read()
+    return frame if ret else None
+
+def copy_with_frame(cap, out, n, change, progress=None):
+    # Single pass over the cover: every frame is written to `out`, frame `n` is replaced by
+    # change(frame). Returns the changed frame, or None if the video has fewer frames.
+    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or None
+    changed = None
+    frame_number = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame_number += 1
+        if frame_number == n:
+            frame = changed = change(frame)
+        out.write(frame)
+        if progress:
+            progress(frame_number, total)
+    return changed
+
+def frame_capacity(cap):
+    # Payload bytes one frame can hold next to the frame and chunk headers
+    pixels = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) * int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    return max(0, (pixels * 3) // 8 - framing.HEADER_SIZE - CHUNK_HEADER.size)
+
+def _embed_chunk(frame, index, count, chunk, flags=0):
+    return lsb_engine.embed_message(frame, CHUNK_HEADER.pack(index, count) + bytes(chunk), flags=flags)
+
+def _extract_chunk(frame):
+    found = lsb_engine.extract_framed(frame)
+    if found is None or len(found[1]) < CHUNK_HEADER.size:
+        raise ValueError("Selected frame does not carry a payload chunk")
+    flags, data = found
+    index, count = CHUNK_HEADER.unpack_from(data)
+    return index, count, flags, data[CHUNK_HEADER.size:]
+
+def _iter_selected(cap, start, stride):
+    # Yields (frame_number, frame) for start, start + stride, ... and only grabs the others
+    frame_number = 0
+    while True:
+        frame_number += 1
+        if frame_number >= start and (frame_number - start) % stride == 0:
+            ret, frame = cap.read()
+            if not ret:
+                return
+            yield frame_number, frame
+        elif not cap.grab():
+            return
+
+def embed_spread(cap, out, payload, start=1, stride=1, workers=None, progress=None, flags=0):
+    # Splits the payload over frames start, start + stride, ... of the cover. Frames are
+    # embedded on a thread pool while the writer keeps the original frame order; every
+    # chunk header carries `flags`. `payload` is bytes or a framing.Payload, which is read
+    # one frame chunk at a time. Returns the number of frames used.
+    capacity = frame_capacity(cap)
+    if capacity == 0:
+        raise ValueError("Video frames are too small to carry a payload chunk")
+    payload = framing.as_payload(payload, flags)
+    count = max(1, -(-payload.length // capacity))
+    last = start + stride * (count - 1)
+    total = frame_count(cap)
+    if start < 1 or stride < 1 or last > total:
+        raise ValueError(f"Payload needs {count} frames up to frame {last}, Need Longer Video or give Less Data !!")
+    chunks = {start + stride * i: i for i in range(count)}
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    written = 0
+
+    def flush(limit):
+        # Writes finished frames in order; waits on the oldest one while more than `limit` are queued
+        nonlocal written
+        while pending:
+            item = pending[0]
+            if isinstance(item, Future):
+                if len(pending) <= limit and not item.done():
+                    return
+                item = item.result()
+            pending.popleft()
+            out.write(item)
+            written += 1
+            if progress:
+                progress(written, total)
+
+    with ThreadPoolExecutor(workers) as pool:
+        frame_number = 0
+        embedded = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame_number += 1
+            if frame_number in chunks:
+                i = chunks[frame_number]
+                # Chunks are read in frame order, so the payload is read front to back
+                chunk = payload.read(capacity)
+                pending.append(pool.submit(_embed_chunk, frame, i, count, chunk, payload.flags))
+                embedded += 1
+            else:
+                pending.append(frame)
+            flush(max_pending)
+        flush(0)
+    # The frame count comes from container metadata, which can overstate it
+    if embedded < count:
+        raise ValueError(f"Video ended at frame {frame_number} before every payload chunk was embedded "
+                         f"(needs frame {last})")
+    return count
+
+def extract_spread_framed(cap, start=1, stride=1, workers=None, progress=None):
+    # Reverse of embed_spread, returns (flags, payload); the first chunk tells how many
+    # frames have to be read
+    with ThreadPoolExecutor(workers) as pool:
+        futures = []
+        count = None
+        for frame_number, frame in _iter_selected(cap, start, stride):
+            futures.append(pool.submit(_extract_chunk, frame))
+            if count is None:
+                count = futures[0].result()[1]
+            if progress:
+                progress(len(futures), count)
+            if len(futures) == count:
+                break
+        results = [future.result() for future in futures]
+    if count is None or len(results) < count:
+        raise ValueError("Video ended before every payload chunk was found")
+    chunks = {index: data for index, total, flags, data in results}
+    if sorted(chunks) != list(range(count)):
+        raise ValueError("Payload chunks are missing or out of order in the selected frames")
+    return results[0][2], b''.join(chunks[i] for i in range(count))